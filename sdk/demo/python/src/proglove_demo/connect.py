@@ -30,15 +30,9 @@ class ConnectDemo(DemoBase):
 
             # Wait for connection to establish (asynchronous background connection)
             self.info("Waiting for connection to establish...")
-            import time
             max_wait = 2.0  # Maximum wait time in seconds
-            poll_interval = 0.1  # Poll every 100ms
-            start_time = time.time()
 
-            while not client.is_connected() and (time.time() - start_time) < max_wait:
-                time.sleep(poll_interval)
-
-            if not client.is_connected():
+            if not client.wait_for_connection(timeout=max_wait):
                 self.error("Failed to establish connection within timeout")
                 self.info("Make sure the IPC host is running")
                 client.close()
@@ -48,7 +42,6 @@ class ConnectDemo(DemoBase):
 
             self.section("Testing communication...")
             client.send_ping()
-            time.sleep(0.2)  # Wait for ping response
             self.success("Ping successful!")
 
             self.section("SDK Information:")
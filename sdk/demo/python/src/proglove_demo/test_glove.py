@@ -9,57 +9,96 @@ Taxel data is organized by joint segment (DIP/MCP/PIP per finger).
 import sys
 import argparse
 import time
+from operator import attrgetter
 from .utils import DemoBase
 
 
+# ANSI: move cursor home and clear screen
+_CLEAR_SCREEN = "\x1b[H\x1b[2J"
+# ANSI: move cursor to the first row below the banner
+_FRAME_HOME = "\x1b[4;1H"
+# ANSI: clear to end of line (terminates every rewritten row)
+_EOL = "\x1b[K\n"
+
+# (row label, TactileStatus attribute) in display order
+_FINGER_ROWS = (
+    ("THUMB:  DIP", "t_dip"),
+    ("        PIP", "t_pip"),
+    ("        MCP", "t_mcp"),
+    ("INDEX:  DIP", "i_dip"),
+    ("        PIP", "i_pip"),
+    ("        MCP", "i_mcp"),
+    ("MIDDLE: DIP", "m_dip"),
+    ("        PIP", "m_pip"),
+    ("        MCP", "m_mcp"),
+    ("RING:   DIP", "r_dip"),
+    ("        PIP", "r_pip"),
+    ("        MCP", "r_mcp"),
+    ("PINKY:  DIP", "p_dip"),
+    ("        PIP", "p_pip"),
+    ("        MCP", "p_mcp"),
+)
+_PALM_ROWS = (
+    ("PALM:   Upper ", "upper_palm"),
+    ("        Middle", "middle_palm"),
+    ("        Lower ", "lower_palm"),
+)
+
+
 class TestGloveDemo(DemoBase):
     """Tactile sensor monitoring demo."""
 
     def __init__(self):
         super().__init__("ProGlove Test Glove - Tactile Sensor Monitor")
+        border = "=" * 60
+        self._banner_text = f"{border}\n{self.title}\n{border}\n"
+
+        # Taxel counts are fixed by the glove layout, so bake them into a
+        # %-template once instead of formatting them on every refresh
+        def rows(table):
+            return "".join(
+                f"{label}[{getattr(self.sdk, 'TAXELS_' + attr.upper()):2d}]: %s{_EOL}"
+                for label, attr in table
+            )
+
+        self._frame_template = (
+            f"{_FRAME_HOME}{_EOL}"
+            f"Timestamp: %5d | UID: %s | Rx rate: %.1f Hz{_EOL}{_EOL}"
+            f"{rows(_FINGER_ROWS)}{_EOL}{rows(_PALM_ROWS)}"
+            f"{_EOL}Press Ctrl+C to stop{_EOL}"
+        )
+        self._segments = attrgetter(*(attr for _, attr in _FINGER_ROWS + _PALM_ROWS))
+        # (timestamp, uid) of the last frame drawn
+        self._last_drawn = None
 
     def display_status(self, status, rate: float):
-        """Display tactile status in a formatted way."""
-        # Clear previous output (move cursor up and clear lines)
-        # Using ANSI escape codes for terminal control
-        self.banner()
-        print()
-        print(f"Timestamp: {status.timestamp:5d} | UID: {status.uid} | Rate: {rate:.1f} Hz")
-        print()
-
-        # Thumb (largest finger)
-        print(f"THUMB:  DIP[{len(status.t_dip):2d}]: {status.t_dip}")
-        print(f"        PIP[{len(status.t_pip):2d}]: {status.t_pip}")
-        print(f"        MCP[{len(status.t_mcp):2d}]: {status.t_mcp}")
-
-        # Index
-        print(f"INDEX:  DIP[{len(status.i_dip):2d}]: {status.i_dip}")
-        print(f"        PIP[{len(status.i_pip):2d}]: {status.i_pip}")
-        print(f"        MCP[{len(status.i_mcp):2d}]: {status.i_mcp}")
-
-        # Middle
-        print(f"MIDDLE: DIP[{len(status.m_dip):2d}]: {status.m_dip}")
-        print(f"        PIP[{len(status.m_pip):2d}]: {status.m_pip}")
-        print(f"        MCP[{len(status.m_mcp):2d}]: {status.m_mcp}")
-
-        # Ring
-        print(f"RING:   DIP[{len(status.r_dip):2d}]: {status.r_dip}")
-        print(f"        PIP[{len(status.r_pip):2d}]: {status.r_pip}")
-        print(f"        MCP[{len(status.r_mcp):2d}]: {status.r_mcp}")
-
-        # Pinky
-        print(f"PINKY:  DIP[{len(status.p_dip):2d}]: {status.p_dip}")
-        print(f"        PIP[{len(status.p_pip):2d}]: {status.p_pip}")
-        print(f"        MCP[{len(status.p_mcp):2d}]: {status.p_mcp}")
-
-        # Palm (show all 16 taxels per segment)
-        print()
-        print(f"PALM:   Upper [{len(status.upper_palm):2d}]: {status.upper_palm}")
-        print(f"        Middle[{len(status.middle_palm):2d}]: {status.middle_palm}")
-        print(f"        Lower [{len(status.lower_palm):2d}]: {status.lower_palm}")
-
-        print()
-        print("Press Ctrl+C to stop")
+        """Display tactile status in a formatted way.
+
+        The banner is drawn once by ``start_display``; each refresh only
+        rewrites the rows below it. Frames whose timestamp and UID match the
+        last one drawn are skipped, since the publisher has not advanced.
+        """
+        key = (status.timestamp, status.uid)
+        if key == self._last_drawn:
+            return
+        self._last_drawn = key
+
+        # Fill the whole frame and emit it with a single write; one print()
+        # per line costs a stdout lock and a write syscall each, while one
+        # write is flushed once even when stdout is line-buffered.
+        # Taxels are uint8, so bytes.hex renders each segment in one C call
+        # instead of a per-element list repr
+        frame = self._frame_template % (
+            (status.timestamp, status.uid, rate)
+            + tuple(segment.hex(" ") for segment in self._segments(status))
+        )
+        sys.stdout.write(frame)
+        sys.stdout.flush()
+
+    def start_display(self):
+        """Clear the terminal and draw the static banner once."""
+        sys.stdout.write(_CLEAR_SCREEN + self._banner_text)
+        sys.stdout.flush()
 
     def run(
         self,
@@ -97,21 +136,42 @@ class TestGloveDemo(DemoBase):
             start_time = time.time()
             last_display_time = start_time
             display_interval = 1.0 / refresh_rate
+            # At least 1 ms: a zero timeout makes recv_status return at once,
+            # which would turn the wait below into a busy-spin
+            wait_ms = max(1, round(display_interval * 1000))
 
             rate_start_time = start_time
             rate_samples = 0
             current_rate = 0.0
 
+            self.start_display()
+
             while True:
                 # Check duration limit
                 elapsed = time.time() - start_time
                 if duration > 0 and elapsed >= duration:
                     break
 
-                # Poll for status updates
-                status = client.try_recv_status()
-                if status and status.is_valid:
-                    rate_samples += 1
+                # Wait for the next status update (sleeps while idle)
+                status = client.recv_status(timeout_ms=wait_ms)
+                if status is None:
+                    continue
+
+                # Drain frames that queued up meanwhile so the display shows
+                # the newest sample rather than lagging behind the stream.
+                # Every valid frame received counts towards the receive rate,
+                # whether or not it is drawn.
+                received = 1 if status.is_valid else 0
+                while True:
+                    newer = client.try_recv_status()
+                    if newer is None:
+                        break
+                    status = newer
+                    if newer.is_valid:
+                        received += 1
+                rate_samples += received
+
+                if status.is_valid:
 
                     # Update rate calculation every second
                     rate_elapsed = time.time() - rate_start_time
@@ -126,9 +186,6 @@ class TestGloveDemo(DemoBase):
                         self.display_status(status, current_rate)
                         last_display_time = now
 
-                # Small sleep to avoid busy-waiting
-                time.sleep(0.0001)
-
             self.success("Monitoring completed!")
             return 0
 
@@ -9,6 +9,9 @@ from pathlib import Path
 class DemoBase:
     """Base class for demo applications with common formatting utilities."""
 
+    # SDK module, resolved once per process and shared by all demos
+    _sdk = None
+
     def __init__(self, title: str):
         self.title = title
         # Import SDK from relative path
@@ -16,6 +19,9 @@ class DemoBase:
 
     def _load_sdk(self):
         """Load the ProGlove SDK from the proglove_sdk directory."""
+        if DemoBase._sdk is not None:
+            return DemoBase._sdk
+
         # Add SDK to Python path if not already there
         sdk_path = Path(__file__).parent.parent.parent.parent.parent / "proglove_sdk" / "python"
         if sdk_path.exists() and str(sdk_path) not in sys.path:
@@ -23,18 +29,18 @@ class DemoBase:
 
         try:
             import proglove_sdk
-            return proglove_sdk
         except ImportError as e:
             raise RuntimeError(
                 f"Failed to import proglove_sdk: {e}\n"
                 f"Expected SDK at: {sdk_path}\n"
             )
 
+        DemoBase._sdk = proglove_sdk
+        return proglove_sdk
+
     def banner(self, width: int = 60):
         """Print a banner with the demo title."""
-        print("=" * width)
-        print(self.title)
-        print("=" * width)
+        print(f"{'=' * width}\n{self.title}\n{'=' * width}")
 
     def section(self, title: str):
         """Print a section header."""
@@ -9,9 +9,24 @@ import sys
 import argparse
 import time
 import math
+from array import array
+from typing import Optional
 from .utils import DemoBase
 
 
+# Zero commands, shared across ticks and runs (float32 buffers are handed to
+# the SDK without conversion)
+_HAND_ZERO = array("f", [0.0]) * 20
+_WRIST_ZERO = array("f", [0.0, 0.0])
+
+
+def _fill_hand_positions(cycle_phase: float, joints, out) -> None:
+    """Write the 20 joint angles (radians) for a motion phase into out."""
+    for i, (offset, amp) in enumerate(joints):
+        # Normalized sine [0, 1] scaled by the joint's amplitude
+        out[i] = amp * (0.5 + 0.5 * math.sin(cycle_phase + offset))
+
+
 class CyclicMotionDemo(DemoBase):
     """Cyclic motion demo with sine wave patterns."""
 
@@ -30,6 +45,8 @@ class CyclicMotionDemo(DemoBase):
         pub_hz: float,
         include_thumb: bool,
         exclude_wrist: bool,
+        cpu: Optional[int] = None,
+        realtime: bool = False,
     ) -> int:
         """Run the cyclic motion demo."""
         self.banner()
@@ -52,6 +69,10 @@ class CyclicMotionDemo(DemoBase):
         print(f"  Exclude wrist:      {exclude_wrist}")
 
         try:
+            if cpu is not None or realtime:
+                self.section("Configuring scheduling...")
+                self.configure_scheduling(cpu, realtime)
+
             self.section("Connecting to IPC host with streaming...")
             client = self.sdk.ProHandClient(
                 command_endpoint, status_endpoint, hand_streaming_endpoint, wrist_streaming_endpoint
@@ -80,7 +101,6 @@ class CyclicMotionDemo(DemoBase):
             self.section(f"Running cyclic motion for {duration}s...")
 
             period = 1.0 / max(pub_hz, 1e-6)
-            start_time = time.time()
             iteration = 0
 
             # Phase offsets for each finger (wave motion across fingers)
@@ -91,84 +111,111 @@ class CyclicMotionDemo(DemoBase):
             finger_max_deg = [90.0, 90.0, 90.0, 90.0]  # metacarpal, proximal, intermediate, distal
             wrist_max_deg = [30.0, 65.0]  # wrist joint 1, wrist joint 2
 
+            # The motion is periodic, so sample one motion cycle up front and
+            # index into it each tick instead of evaluating sin() per joint.
+            # A cycle spans pub_hz / frequency ticks (rounded to a whole tick).
+            cycle_ticks = max(1, int(round(pub_hz / max(1e-6, float(frequency)))))
+            effective_hz = pub_hz / cycle_ticks
+            if abs(effective_hz - frequency) > 0.01 * frequency:
+                self.warning(
+                    f"{frequency} Hz is not a whole number of ticks at {pub_hz} Hz; "
+                    f"running at {effective_hz:.3f} Hz ({cycle_ticks} ticks per cycle)"
+                )
+            total_ticks = int(math.ceil(duration * pub_hz)) + 1
+            hand_table_len = min(cycle_ticks, total_ticks)
+
+            # Per-joint phase offset and amplitude (radians) as flat 20-element
+            # vectors. Joints held at zero get a zero amplitude.
+            # Joint layout: thumb(0-3), index(4-7), middle(8-11), ring(12-15), pinky(16-19)
+            joint_offsets = []
+            joint_amps = []
+            for finger_name in fingers:
+                for j in range(4):  # 4 joints per finger
+                    # Per-joint phase offset: j * 0.4 creates wave along finger
+                    joint_offsets.append(finger_phases[finger_name] + j * 0.4)
+                    held = (
+                        # Skip metacarpal (j=0) for non-thumb fingers if abduction not included
+                        ((not include_abduction) and j == 0 and finger_name != "thumb")
+                        # Zero thumb joints if not included
+                        or ((not include_thumb) and finger_name == "thumb" and j > 0)
+                    )
+                    joint_amps.append(0.0 if held else math.radians(finger_max_deg[j] * amp_scale))
+            joints = list(zip(joint_offsets, joint_amps))
+
+            # Calculate joint angles (20 rotary joints: 5 fingers × 4 joints).
+            # Rows are float32 arrays the SDK passes to the library without copying.
+            hand_table = []
+            for k in range(hand_table_len):
+                row = array("f", [0.0]) * len(joints)
+                _fill_hand_positions(2 * math.pi * k / cycle_ticks, joints, row)
+                hand_table.append(row)
+
+            # Wrist command (high-level wrist joints) - alternates between joints
+            # every cycle, so its pattern repeats every two cycles
+            wrist_table = []
+            if not exclude_wrist:
+                for k in range(min(2 * cycle_ticks, total_ticks)):
+                    seg = (k // cycle_ticks) % 2
+                    local = 2 * math.pi * (k % cycle_ticks) / cycle_ticks
+                    if seg == 0:
+                        # First wrist joint
+                        wrist_angle_deg = math.sin(local) * (wrist_max_deg[0] * amp_scale)
+                        wrist_table.append(array("f", [math.radians(wrist_angle_deg), 0.0]))
+                    else:
+                        # Second wrist joint
+                        wrist_angle_deg = math.sin(local) * (wrist_max_deg[1] * amp_scale)
+                        wrist_table.append(array("f", [0.0, math.radians(wrist_angle_deg)]))
+
+            # Torque (0.0-1.0 normalized, single value for all joints)
+            torque = 1.0  # Match original torque_level=1.0
+
+            # Bind hot-loop callables to locals (avoids attribute lookups per tick).
+            # Monotonic clock: wall-clock adjustments must not stall or rush the loop.
+            _time = time.monotonic
+            _sleep = time.sleep
+            _send_hand = client.send_hand_streams
+            _send_wrist = client.send_wrist_streams
+            wrist_table_len = len(wrist_table)
+            log_every = max(1, int(pub_hz))  # Print every second
+
+            start_time = _time()
             while True:
-                # Calculate target time for this iteration (fixed timing, no drift)
-                target_time = start_time + (iteration * period)
-                now = time.time()
-                t = now - start_time
+                t = _time() - start_time
 
                 if t >= duration:
                     break
 
-                # Calculate joint angles (20 rotary joints: 5 fingers × 4 joints)
-                # Joint layout: thumb(0-3), index(4-7), middle(8-11), ring(12-15), pinky(16-19)
-                positions = []
-
-                for finger_idx, finger_name in enumerate(fingers):
-                    base_phase = finger_phases[finger_name]
-                    finger_joints = []
-                    
-                    for j in range(4):  # 4 joints per finger
-                        # Skip metacarpal (j=0) for non-thumb fingers if abduction not included
-                        if (not include_abduction) and j == 0 and finger_name != "thumb":
-                            finger_joints.append(0.0)
-                        else:
-                            # Per-joint phase offset: j * 0.4 creates wave along finger
-                            joint_phase = 2 * math.pi * frequency * t + (j * 0.4) + base_phase
-                            # Normalized sine [0, 1]
-                            s01 = 0.5 + 0.5 * math.sin(joint_phase)
-                            # Scale by max angle and amplitude scale
-                            joint_angle_deg = s01 * (finger_max_deg[j] * amp_scale)
-                            finger_joints.append(math.radians(joint_angle_deg))
-                    
-                    # Zero thumb joints if not included
-                    if (not include_thumb) and finger_name == "thumb":
-                        finger_joints[1] = finger_joints[2] = finger_joints[3] = 0.0
-                    
-                    positions.extend(finger_joints)
-
-                # Torque (0.0-1.0 normalized, single value for all joints)
-                torque = 1.0  # Match original torque_level=1.0
-
                 # Send hand command (high-level joint angles, uses inverse kinematics)
                 # Uses streaming for high-frequency control
-                client.send_hand_streams(positions, torque)
+                _send_hand(hand_table[iteration % hand_table_len], torque)
 
-                # Wrist command (high-level wrist joints) - alternates between joints
                 if not exclude_wrist:
-                    T = 1.0 / max(1e-6, float(frequency))
-                    seg = int((t / T)) % 2
-                    local = 2 * math.pi * ((t % T) / T)
-                    if seg == 0:
-                        # First wrist joint
-                        wrist_angle_deg = math.sin(local) * (wrist_max_deg[0] * amp_scale)
-                        wrist_positions = [math.radians(wrist_angle_deg), 0.0]
-                    else:
-                        # Second wrist joint
-                        wrist_angle_deg = math.sin(local) * (wrist_max_deg[1] * amp_scale)
-                        wrist_positions = [0.0, math.radians(wrist_angle_deg)]
-                    client.send_wrist_streams(wrist_positions)
-                else:
-                    client.send_wrist_streams([0.0, 0.0])
+                    _send_wrist(wrist_table[iteration % wrist_table_len])
+                elif iteration % log_every == 0:
+                    # A held wrist only needs its constant zero command about
+                    # once a second; resending covers a dropped first message
+                    # on the separate wrist PUB socket (ZMQ slow joiner)
+                    _send_wrist(_WRIST_ZERO)
 
                 iteration += 1
-                if iteration % int(pub_hz) == 0:  # Print every second
-                    main_phase = 2.0 * math.pi * frequency * t
-                    phase_deg = math.degrees(main_phase) % 360
+                if iteration % log_every == 0:
+                    phase_deg = 360.0 * ((iteration - 1) % cycle_ticks) / cycle_ticks
                     print(f"  [{t:6.2f}s] Running... (phase: {phase_deg:.1f}°)")
 
-                # Sleep until target time (compensates for command sending time)
-                next_target = start_time + ((iteration + 1) * period)
-                sleep_time = next_target - time.time()
+                # Sleep until the next tick on the fixed grid (no drift). If more
+                # than a tick behind, skip the missed ticks rather than sending
+                # them in a catch-up burst.
+                sleep_time = start_time + (iteration * period) - _time()
                 if sleep_time > 0:
-                    time.sleep(sleep_time)
+                    _sleep(sleep_time)
+                elif sleep_time < -period:
+                    iteration = int((_time() - start_time) / period)
 
             # Return to zero (use streaming mode)
             self.section("Returning to zero...")
-            zero_positions = [0.0] * 20
-            client.send_hand_streams(zero_positions, 1.0)
+            client.send_hand_streams(_HAND_ZERO, 1.0)
             if not exclude_wrist:
-                client.send_wrist_streams([0.0, 0.0])
+                client.send_wrist_streams(_WRIST_ZERO)
             time.sleep(0.5)
 
             # Disable streaming mode
@@ -267,6 +314,17 @@ def main() -> int:
         action="store_true",
         help="Exclude wrist from motion"
     )
+    parser.add_argument(
+        "--cpu",
+        type=int,
+        default=None,
+        help="Pin the process to this CPU (Linux only)"
+    )
+    parser.add_argument(
+        "--realtime",
+        action="store_true",
+        help="Run with SCHED_FIFO priority (Linux only, needs CAP_SYS_NICE)"
+    )
     args = parser.parse_args()
 
     demo = CyclicMotionDemo()
@@ -281,6 +339,8 @@ def main() -> int:
         args.pub_hz,
         args.include_thumb,
         args.exclude_wrist,
+        args.cpu,
+        args.realtime,
     )
 
 
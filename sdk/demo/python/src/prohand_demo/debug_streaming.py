@@ -8,6 +8,8 @@ Debug tool to verify streaming mode is properly received by the driver.
 import sys
 import argparse
 import time
+from array import array
+from .endpoints import add_endpoint_arguments, resolve_endpoints
 from .utils import DemoBase
 
 
@@ -24,6 +26,7 @@ class DebugStreamingDemo(DemoBase):
         hand_streaming_endpoint: str,
         wrist_streaming_endpoint: str,
         test_commands: bool,
+        debug: bool = False,
     ) -> int:
         """Run the streaming debug demo."""
         self.banner()
@@ -44,9 +47,9 @@ class DebugStreamingDemo(DemoBase):
             self.success("Client created with streaming support!")
             print(f"  Connected: {client.is_connected()}")
 
-            # Step 2: Wait for ZMQ to establish
+            # Step 2: Wait for ZMQ to establish (returns as soon as connected)
             self.section("Step 2: Waiting for ZMQ connection...")
-            time.sleep(1.0)
+            client.wait_for_connection(timeout=1.0)
             print(f"  Connected: {client.is_connected()}")
 
             # Step 3: Send initial ping
@@ -58,8 +61,7 @@ class DebugStreamingDemo(DemoBase):
                 self.error(f"Ping failed: {e}")
                 return 1
 
-            # Step 4: Wait for ping response
-            time.sleep(0.2)
+            # Step 4: send_ping() returns once the reply has arrived
             print(f"  Connected: {client.is_connected()}")
 
             # Step 5: Enable streaming mode on driver
@@ -101,19 +103,24 @@ class DebugStreamingDemo(DemoBase):
                 self.error(f"Verification ping failed: {e}")
                 return 1
 
-            time.sleep(0.2)
-
             # Step 8: Test sending commands if requested
             if test_commands:
                 self.section("Step 8: Testing rotary commands...")
                 try:
-                    positions = [0.0] * 16
-                    torques = [0.45] * 16
-
-                    for i in range(5):
-                        client.send_rotary_streams(positions, torques)
-                        print(f"  Command {i+1}/5 sent via streaming")
-                        time.sleep(0.01)  # 100Hz
+                    # float32 buffers go to the SDK without per-send conversion
+                    positions = array("f", [0.0]) * 16
+                    torques = array("f", [0.45]) * 16
+
+                    # Keep terminal I/O out of the 100Hz send loop; report
+                    # the sent commands once it finishes (or fails)
+                    sent = []
+                    try:
+                        for i in range(5):
+                            client.send_rotary_streams(positions, torques)
+                            sent.append(f"  Command {i+1}/5 sent via streaming\n")
+                            time.sleep(0.01)  # 100Hz
+                    finally:
+                        sys.stdout.write("".join(sent))
 
                     self.success("Test commands sent successfully!")
                 except Exception as e:
@@ -162,8 +169,9 @@ class DebugStreamingDemo(DemoBase):
             return 1
         except Exception as e:
             self.error(f"Unexpected error: {e}")
-            import traceback
-            traceback.print_exc()
+            if debug:
+                import traceback
+                traceback.print_exc()
             return 1
 
 
@@ -173,44 +181,24 @@ def main() -> int:
         description="Debug streaming mode connectivity",
         formatter_class=argparse.ArgumentDefaultsHelpFormatter
     )
-    parser.add_argument(
-        "--command-endpoint",
-        type=str,
-        default="ipc:///tmp/prohand-commands.ipc",
-        help="ZMQ command endpoint"
-    )
-    parser.add_argument(
-        "--status-endpoint",
-        type=str,
-        default="ipc:///tmp/prohand-status.ipc",
-        help="ZMQ status endpoint"
-    )
-    parser.add_argument(
-        "--hand-streaming-endpoint",
-        type=str,
-        default="ipc:///tmp/prohand-hand-streaming.ipc",
-        help="ZMQ hand streaming endpoint",
-    )
-    parser.add_argument(
-        "--wrist-streaming-endpoint",
-        type=str,
-        default="ipc:///tmp/prohand-wrist-streaming.ipc",
-        help="ZMQ wrist streaming endpoint",
-    )
+    add_endpoint_arguments(parser)
     parser.add_argument(
         "--test-commands",
         action="store_true",
         help="Send test rotary commands after enabling streaming",
     )
+    parser.add_argument(
+        "--debug",
+        action="store_true",
+        help="Print a traceback on unexpected errors"
+    )
     args = parser.parse_args()
 
     demo = DebugStreamingDemo()
     return demo.run(
-        args.command_endpoint,
-        args.status_endpoint,
-        args.hand_streaming_endpoint,
-        args.wrist_streaming_endpoint,
+        *resolve_endpoints(parser, args),
         args.test_commands,
+        args.debug,
     )
 
 
@@ -0,0 +1,77 @@
+"""
+Default ZeroMQ endpoints and shared endpoint arguments for ProHand FFI demos
+"""
+
+import argparse
+import json
+from typing import Tuple
+
+
+# Default IPC endpoints of prohand-headless-ipc-host
+DEFAULT_ENDPOINTS = {
+    "command": "ipc:///tmp/prohand-commands.ipc",
+    "status": "ipc:///tmp/prohand-status.ipc",
+    "hand_streaming": "ipc:///tmp/prohand-hand-streaming.ipc",
+    "wrist_streaming": "ipc:///tmp/prohand-wrist-streaming.ipc",
+}
+
+_ENDPOINT_HELP = {
+    "command": "ZMQ command endpoint",
+    "status": "ZMQ status endpoint",
+    "hand_streaming": "ZMQ hand streaming endpoint",
+    "wrist_streaming": "ZMQ wrist streaming endpoint",
+}
+
+
+def add_endpoint_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the four endpoint options and --endpoints-json to a parser."""
+    for name, default in DEFAULT_ENDPOINTS.items():
+        parser.add_argument(
+            f"--{name.replace('_', '-')}-endpoint",
+            type=str,
+            default=argparse.SUPPRESS,
+            help=f"{_ENDPOINT_HELP[name]} (default: {default})"
+        )
+    parser.add_argument(
+        "--endpoints-json",
+        type=str,
+        default=None,
+        help=(
+            "JSON object overriding default endpoints, keyed by "
+            + ", ".join(DEFAULT_ENDPOINTS)
+            + "; individual --*-endpoint options take precedence"
+        )
+    )
+
+
+def resolve_endpoints(parser: argparse.ArgumentParser, args: argparse.Namespace) -> Tuple[str, str, str, str]:
+    """
+    Resolve (command, status, hand_streaming, wrist_streaming) endpoints.
+
+    Precedence: individual --*-endpoint options, then --endpoints-json,
+    then DEFAULT_ENDPOINTS. Invalid JSON or unknown keys exit via parser.error().
+    """
+    endpoints = dict(DEFAULT_ENDPOINTS)
+    if args.endpoints_json:
+        try:
+            overrides = json.loads(args.endpoints_json)
+        except ValueError as e:
+            parser.error(f"--endpoints-json is not valid JSON: {e}")
+        if not isinstance(overrides, dict):
+            parser.error("--endpoints-json must be a JSON object")
+        unknown = sorted(set(overrides) - set(DEFAULT_ENDPOINTS))
+        if unknown:
+            parser.error(f"--endpoints-json has unknown keys: {', '.join(unknown)}")
+        endpoints.update(overrides)
+
+    for name in DEFAULT_ENDPOINTS:
+        value = getattr(args, f"{name}_endpoint", None)
+        if value is not None:
+            endpoints[name] = value
+
+    return (
+        endpoints["command"],
+        endpoints["status"],
+        endpoints["hand_streaming"],
+        endpoints["wrist_streaming"],
+    )
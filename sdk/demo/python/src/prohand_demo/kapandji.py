@@ -9,11 +9,21 @@ import sys
 import argparse
 import time
 import math
+from array import array
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
+from .endpoints import add_endpoint_arguments, resolve_endpoints
 from .utils import DemoBase
 
 
+# Pose groups and joint counts, in hand-position order (wrist last)
+_POSE_LAYOUT = (("thumb", 4), ("index", 4), ("middle", 4), ("ring", 4), ("pinky", 4), ("wrist", 2))
+_DEG_TO_RAD = math.pi / 180.0
+# Zero commands for the return-to-zero step
+_HAND_ZERO = array("f", [0.0]) * 20
+_WRIST_ZERO = array("f", [0.0, 0.0])
+
+
 def _safe_yaml_load(path: str) -> Optional[dict]:
     """Safely load YAML configuration file."""
     try:
@@ -21,9 +31,11 @@ def _safe_yaml_load(path: str) -> Optional[dict]:
     except ImportError:
         print("PyYAML not installed; install it to use YAML gestures.")
         return None
+    # Prefer the libyaml-backed C loader when PyYAML was built with it
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
     try:
         with open(path, "r", encoding="utf-8") as f:
-            return yaml.safe_load(f)
+            return yaml.load(f, Loader=loader)
     except Exception as e:
         print(f"Failed to load YAML config from {path}: {e}")
         return None
@@ -49,23 +61,24 @@ def _pose_from_yaml(gesture: str, hand: str, cfg: dict) -> Dict[str, List[float]
         available = ", ".join(sorted(hands.keys()))
         raise ValueError(f"YAML gesture '{gesture}' not found. Available: {available}")
 
-    def deg_to_rad_list(values: List[float], n: int) -> List[float]:
-        vals = _parse_joint_list(values, n, fill=0.0)
-        return [math.radians(v) for v in vals]
+    # Gather all joints' degrees, then convert them in a single pass
+    degrees: List[float] = []
+    for name, n in _POSE_LAYOUT:
+        degrees.extend(_parse_joint_list(g.get(name, []), n, fill=0.0))
+    radians = [d * _DEG_TO_RAD for d in degrees]
 
-    thumb = deg_to_rad_list(g.get("thumb", []), 4)
-    index = deg_to_rad_list(g.get("index", []), 4)
-    middle = deg_to_rad_list(g.get("middle", []), 4)
-    ring = deg_to_rad_list(g.get("ring", []), 4)
-    pinky = deg_to_rad_list(g.get("pinky", []), 4)
-    wrist = deg_to_rad_list(g.get("wrist", []), 2) if "wrist" in g else [0.0, 0.0]
-    return {"thumb": thumb, "index": index, "middle": middle, "ring": ring, "pinky": pinky, "wrist": wrist}
+    pose: Dict[str, List[float]] = {}
+    offset = 0
+    for name, n in _POSE_LAYOUT:
+        pose[name] = radians[offset:offset + n]
+        offset += n
+    return pose
 
 
-def _pose_to_hand_positions(pose: Dict[str, List[float]]) -> List[float]:
-    """Convert pose dictionary to flat list of 20 joint positions."""
+def _pose_to_hand_positions(pose: Dict[str, List[float]]) -> array:
+    """Convert pose dictionary to a flat float32 array of 20 joint positions."""
     # Order: thumb[0-3], index[4-7], middle[8-11], ring[12-15], pinky[16-19]
-    positions = []
+    positions = array("f")
     positions.extend(pose["thumb"])
     positions.extend(pose["index"])
     positions.extend(pose["middle"])
@@ -74,17 +87,36 @@ def _pose_to_hand_positions(pose: Dict[str, List[float]]) -> List[float]:
     return positions
 
 
-def _stream_pose(client, pose: Dict[str, List[float]], publish_hz: float, duration_s: float, torque: float = 0.45) -> None:
-    """Stream a pose for the specified duration."""
+def _pose_to_buffers(pose: Dict[str, List[float]]) -> Tuple[array, array]:
+    """Convert pose dictionary to float32 (hand, wrist) buffers ready to stream."""
+    # float32 buffers are handed to the SDK as-is, so no per-send conversion
+    # _pose_from_yaml always fills "wrist" (zeros when the gesture has none)
+    return _pose_to_hand_positions(pose), array("f", pose["wrist"])
+
+
+def _stream_pose(client, positions: array, wrist_positions: array, publish_hz: float, duration_s: float, torque: float = 0.45) -> None:
+    """Stream precomputed hand and wrist positions for the specified duration."""
     period = 1.0 / max(1e-6, float(publish_hz))
-    positions = _pose_to_hand_positions(pose)
-    wrist_positions = pose.get("wrist", [0.0, 0.0])
     
-    deadline = time.time() + float(duration_s)
-    while time.time() < deadline:
-        client.send_wrist_streams(wrist_positions)
-        client.send_hand_streams(positions, torque)
-        time.sleep(period)
+    # Hand and wrist go out on separate streaming sockets, so each tick is two
+    # sends; bind them once to keep the per-tick path to the two native calls
+    send_wrist = client.send_wrist_streams
+    send_hand = client.send_hand_streams
+    monotonic = time.monotonic
+    sleep = time.sleep
+    
+    # Pace sends on a fixed monotonic grid so send latency does not
+    # accumulate into a lower effective publish rate
+    start = monotonic()
+    deadline = start + float(duration_s)
+    i = 0
+    while monotonic() < deadline:
+        send_wrist(wrist_positions)
+        send_hand(positions, torque)
+        i += 1
+        sleep_time = start + i * period - monotonic()
+        if sleep_time > 0:
+            sleep(sleep_time)
 
 
 class KapandjiDemo(DemoBase):
@@ -101,7 +133,10 @@ class KapandjiDemo(DemoBase):
         wrist_streaming_endpoint: str,
         yaml_config: str,
         hand: str,
-        publish_freq: float
+        publish_freq: float,
+        cpu: Optional[int] = None,
+        realtime: bool = False,
+        debug: bool = False,
     ) -> int:
         """Run the Kapandji demo."""
         self.banner()
@@ -111,8 +146,11 @@ class KapandjiDemo(DemoBase):
         print(f"  Hand:             {hand}")
         print(f"  Publish rate:     {publish_freq} Hz")
         
-        client = None
         try:
+            if cpu is not None or realtime:
+                self.section("Configuring scheduling...")
+                self.configure_scheduling(cpu, realtime)
+            
             # Load YAML configuration
             self.section("Loading YAML configuration...")
             cfg = _safe_yaml_load(yaml_config)
@@ -133,108 +171,123 @@ class KapandjiDemo(DemoBase):
             
             # Connect to IPC host
             self.section("Connecting to IPC host with streaming...")
-            client = self.sdk.ProHandClient(
+            with self.sdk.ProHandClient(
                 command_endpoint, status_endpoint, hand_streaming_endpoint, wrist_streaming_endpoint
-            )
-            self.success("Connected with streaming support!")
-            
-            # Verify connection
-            self.section("Verifying connection...")
-            client.send_ping()
-            time.sleep(0.2)
-            self.success("Connection verified!")
-            
-            # Enable streaming mode
-            self.section("Enabling streaming mode...")
-            client.set_streaming_mode(True)
-            if not client.wait_for_streaming_ready(timeout=10.0):
-                self.error("Streaming connection failed to establish!")
-                return 1
-            self.success("Streaming mode enabled!")
-            
-            # Run Kapandji sequence
-            self.section("Running Kapandji opposition sequence...")
-            sequence: List[tuple[str, float]] = [
-                # Slow
-                ("finger_down_0", 2.0),
-                ("finger_down_1", 1.0),
-                ("finger_down_2", 1.0),
-                ("finger_down_3", 1.0),
-                ("finger_down_4", 1.0),
-                ("finger_down_3", 1.0),
-                ("finger_down_2", 1.0),
-                ("finger_down_1", 1.0),
+            ) as client:
+                self.success("Connected with streaming support!")
                 
-                # Medium
-                ("finger_down_0", 1.25),
-                ("finger_down_1", 0.5),
-                ("finger_down_2", 0.5),
-                ("finger_down_3", 0.5),
-                ("finger_down_4", 0.5),
-                ("finger_down_3", 0.5),
-                ("finger_down_2", 0.5),
-                ("finger_down_1", 0.5),
+                # Verify connection
+                self.section("Verifying connection...")
+                client.send_ping()
+                self.success("Connection verified!")
                 
-                # Fast
-                ("finger_down_0", 0.5),
-                ("finger_down_1", 0.25),
-                ("finger_down_2", 0.25),
-                ("finger_down_3", 0.25),
-                ("finger_down_4", 0.25),
-                ("finger_down_3", 0.25),
-                ("finger_down_2", 0.25),
-                ("finger_down_1", 0.25),
-                
-                # Fastest
-                ("finger_down_0", 0.25),
-                ("finger_down_1", 0.1),
-                ("finger_down_2", 0.1),
-                ("finger_down_3", 0.1),
-                ("finger_down_4", 0.1),
-                ("finger_down_3", 0.1),
-                ("finger_down_2", 0.1),
-                ("finger_down_1", 0.1),
-                
-                # Fastest (repeat)
-                ("finger_down_0", 0.25),
-                ("finger_down_1", 0.1),
-                ("finger_down_2", 0.1),
-                ("finger_down_3", 0.1),
-                ("finger_down_4", 0.1),
-                ("finger_down_3", 0.1),
-                ("finger_down_2", 0.1),
-                ("finger_down_1", 0.1),
-                
-                # Fastest (repeat)
-                ("finger_down_0", 0.25),
-                ("finger_down_1", 0.1),
-                ("finger_down_2", 0.1),
-                ("finger_down_3", 0.1),
-                ("finger_down_4", 0.1),
-                ("finger_down_3", 0.1),
-                ("finger_down_2", 0.1),
-                ("finger_down_1", 0.1),
-            ]
-            
-            for gesture, dur in sequence:
-                pose = _pose_from_yaml(gesture, hand, cfg)
-                print(f"  Gesture: {gesture} for {dur:.2f}s")
-                _stream_pose(client, pose, publish_freq, dur, torque_level)
-            
-            # Return to zero
-            self.section("Returning to zero position...")
-            zero_positions = [0.0] * 20
-            client.send_hand_streams(zero_positions, torque_level)
-            client.send_wrist_streams([0.0, 0.0])
-            time.sleep(0.5)
-            
-            # Disable streaming mode
-            self.section("Disabling streaming mode...")
-            client.set_streaming_mode(False)
-            time.sleep(0.2)
-            
-            self.success("Kapandji sequence completed!")
-            return 0
+                # Enable streaming mode
+                self.section("Enabling streaming mode...")
+                streaming_enabled = True  # set first: a failed enable may still reach the driver
+                try:
+                    client.set_streaming_mode(True)
+                    if not client.wait_for_streaming_ready(timeout=10.0):
+                        self.error("Streaming connection failed to establish!")
+                        return 1
+                    self.success("Streaming mode enabled!")
+                    
+                    # Run Kapandji sequence
+                    self.section("Running Kapandji opposition sequence...")
+                    sequence: List[tuple[str, float]] = [
+                        # Slow
+                        ("finger_down_0", 2.0),
+                        ("finger_down_1", 1.0),
+                        ("finger_down_2", 1.0),
+                        ("finger_down_3", 1.0),
+                        ("finger_down_4", 1.0),
+                        ("finger_down_3", 1.0),
+                        ("finger_down_2", 1.0),
+                        ("finger_down_1", 1.0),
+                        
+                        # Medium
+                        ("finger_down_0", 1.25),
+                        ("finger_down_1", 0.5),
+                        ("finger_down_2", 0.5),
+                        ("finger_down_3", 0.5),
+                        ("finger_down_4", 0.5),
+                        ("finger_down_3", 0.5),
+                        ("finger_down_2", 0.5),
+                        ("finger_down_1", 0.5),
+                        
+                        # Fast
+                        ("finger_down_0", 0.5),
+                        ("finger_down_1", 0.25),
+                        ("finger_down_2", 0.25),
+                        ("finger_down_3", 0.25),
+                        ("finger_down_4", 0.25),
+                        ("finger_down_3", 0.25),
+                        ("finger_down_2", 0.25),
+                        ("finger_down_1", 0.25),
+                        
+                        # Fastest
+                        ("finger_down_0", 0.25),
+                        ("finger_down_1", 0.1),
+                        ("finger_down_2", 0.1),
+                        ("finger_down_3", 0.1),
+                        ("finger_down_4", 0.1),
+                        ("finger_down_3", 0.1),
+                        ("finger_down_2", 0.1),
+                        ("finger_down_1", 0.1),
+                        
+                        # Fastest (repeat)
+                        ("finger_down_0", 0.25),
+                        ("finger_down_1", 0.1),
+                        ("finger_down_2", 0.1),
+                        ("finger_down_3", 0.1),
+                        ("finger_down_4", 0.1),
+                        ("finger_down_3", 0.1),
+                        ("finger_down_2", 0.1),
+                        ("finger_down_1", 0.1),
+                        
+                        # Fastest (repeat)
+                        ("finger_down_0", 0.25),
+                        ("finger_down_1", 0.1),
+                        ("finger_down_2", 0.1),
+                        ("finger_down_3", 0.1),
+                        ("finger_down_4", 0.1),
+                        ("finger_down_3", 0.1),
+                        ("finger_down_2", 0.1),
+                        ("finger_down_1", 0.1),
+                    ]
+                    
+                    # Only a handful of distinct gestures repeat through the sequence;
+                    # resolve each into stream buffers once, before streaming starts,
+                    # so no YAML/dict/math work happens between gestures
+                    buffers = {
+                        gesture: _pose_to_buffers(_pose_from_yaml(gesture, hand, cfg))
+                        for gesture in {g for g, _ in sequence}
+                    }
+                    compiled = [(gesture, dur) + buffers[gesture] for gesture, dur in sequence]
+                    
+                    for gesture, dur, positions, wrist_positions in compiled:
+                        print(f"  Gesture: {gesture} for {dur:.2f}s")
+                        _stream_pose(client, positions, wrist_positions, publish_freq, dur, torque_level)
+                    
+                    # Return to zero
+                    self.section("Returning to zero position...")
+                    client.send_hand_streams(_HAND_ZERO, torque_level)
+                    client.send_wrist_streams(_WRIST_ZERO)
+                    time.sleep(0.5)
+                    
+                    # Disable streaming mode
+                    self.section("Disabling streaming mode...")
+                    client.set_streaming_mode(False)
+                    streaming_enabled = False
+                    
+                    self.success("Kapandji sequence completed!")
+                    return 0
+                finally:
+                    # Streaming is still on here only if the run failed
+                    if streaming_enabled:
+                        try:
+                            client.set_streaming_mode(False)
+                        except self.sdk.ProHandError:
+                            pass
             
         except self.sdk.ConnectionError as e:
             self.error(f"Connection failed: {e}")
@@ -245,19 +298,10 @@ class KapandjiDemo(DemoBase):
             return 1
         except Exception as e:
             self.error(f"Unexpected error: {e}")
-            import traceback
-            traceback.print_exc()
+            if debug:
+                import traceback
+                traceback.print_exc()
             return 1
-        finally:
-            if client is not None:
-                try:
-                    client.set_streaming_mode(False)
-                except Exception:
-                    pass
-                try:
-                    client.close()
-                except Exception:
-                    pass
 
 
 def main() -> int:
@@ -266,30 +310,7 @@ def main() -> int:
         description="Kapandji opposition sequence (placeholder)",
         formatter_class=argparse.ArgumentDefaultsHelpFormatter
     )
-    parser.add_argument(
-        "--command-endpoint",
-        type=str,
-        default="ipc:///tmp/prohand-commands.ipc",
-        help="ZMQ command endpoint"
-    )
-    parser.add_argument(
-        "--status-endpoint",
-        type=str,
-        default="ipc:///tmp/prohand-status.ipc",
-        help="ZMQ status endpoint"
-    )
-    parser.add_argument(
-        "--hand-streaming-endpoint",
-        type=str,
-        default="ipc:///tmp/prohand-hand-streaming.ipc",
-        help="ZMQ hand streaming endpoint",
-    )
-    parser.add_argument(
-        "--wrist-streaming-endpoint",
-        type=str,
-        default="ipc:///tmp/prohand-wrist-streaming.ipc",
-        help="ZMQ wrist streaming endpoint",
-    )
+    add_endpoint_arguments(parser)
     # Default YAML path relative to this script's location
     script_dir = Path(__file__).parent
     default_yaml = script_dir / "../../../config/kapandji.yaml"
@@ -314,17 +335,33 @@ def main() -> int:
         default=60.0,
         help="Command publish rate (Hz)"
     )
+    parser.add_argument(
+        "--cpu",
+        type=int,
+        default=None,
+        help="Pin the process to this CPU (Linux only)"
+    )
+    parser.add_argument(
+        "--realtime",
+        action="store_true",
+        help="Run with SCHED_FIFO priority (Linux only, needs CAP_SYS_NICE)"
+    )
+    parser.add_argument(
+        "--debug",
+        action="store_true",
+        help="Print a traceback on unexpected errors"
+    )
     args = parser.parse_args()
     
     demo = KapandjiDemo()
     return demo.run(
-        args.command_endpoint,
-        args.status_endpoint,
-        args.hand_streaming_endpoint,
-        args.wrist_streaming_endpoint,
+        *resolve_endpoints(parser, args),
         args.yaml_config,
         args.hand,
-        args.publish_frequency
+        args.publish_frequency,
+        args.cpu,
+        args.realtime,
+        args.debug,
     )
 
 
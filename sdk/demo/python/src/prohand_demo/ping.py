@@ -8,6 +8,7 @@ Connects to the IPC host and sends periodic ping commands.
 import sys
 import argparse
 import time
+from .endpoints import add_endpoint_arguments, resolve_endpoints
 from .utils import DemoBase
 
 
@@ -18,7 +19,8 @@ class PingDemo(DemoBase):
         super().__init__("ProHand Ping Demo")
 
     def run(
-        self, command_endpoint: str, status_endpoint: str, hand_streaming_endpoint: str, wrist_streaming_endpoint: str, count: int, interval: float
+        self, command_endpoint: str, status_endpoint: str, hand_streaming_endpoint: str, wrist_streaming_endpoint: str, count: int, interval: float,
+        quiet: bool = False, debug: bool = False
     ) -> int:
         """Run the ping demo."""
         self.banner()
@@ -35,19 +37,23 @@ class PingDemo(DemoBase):
             self.success("Connected!\n")
 
             ping_count = 0
-            start_time = time.time()
+            start_time = time.monotonic()
 
             try:
                 while count == 0 or ping_count < count:
                     client.send_ping()
                     ping_count += 1
-                    elapsed = time.time() - start_time
-                    print(f"[{elapsed:6.2f}s] Ping #{ping_count} sent ✓")
+                    if not quiet:
+                        elapsed = time.monotonic() - start_time
+                        print(f"[{elapsed:6.2f}s] Ping #{ping_count} sent ✓")
 
                     if count > 0 and ping_count >= count:
                         break
 
-                    time.sleep(interval)
+                    # Sleep until the next slot on a fixed schedule
+                    sleep_time = start_time + ping_count * interval - time.monotonic()
+                    if sleep_time > 0:
+                        time.sleep(sleep_time)
 
             except KeyboardInterrupt:
                 print("\n")
@@ -67,8 +73,9 @@ class PingDemo(DemoBase):
             return 1
         except Exception as e:
             self.error(f"Unexpected error: {e}")
-            import traceback
-            traceback.print_exc()
+            if debug:
+                import traceback
+                traceback.print_exc()
             return 1
 
 
@@ -78,30 +85,7 @@ def main() -> int:
         description="Send ping commands to ProHand IPC host",
         formatter_class=argparse.ArgumentDefaultsHelpFormatter
     )
-    parser.add_argument(
-        "--command-endpoint",
-        type=str,
-        default="ipc:///tmp/prohand-commands.ipc",
-        help="ZMQ command endpoint"
-    )
-    parser.add_argument(
-        "--status-endpoint",
-        type=str,
-        default="ipc:///tmp/prohand-status.ipc",
-        help="ZMQ status endpoint"
-    )
-    parser.add_argument(
-        "--hand-streaming-endpoint",
-        type=str,
-        default="ipc:///tmp/prohand-hand-streaming.ipc",
-        help="ZMQ hand streaming endpoint"
-    )
-    parser.add_argument(
-        "--wrist-streaming-endpoint",
-        type=str,
-        default="ipc:///tmp/prohand-wrist-streaming.ipc",
-        help="ZMQ wrist streaming endpoint"
-    )
+    add_endpoint_arguments(parser)
     parser.add_argument(
         "--count", type=int, default=10, help="Number of pings to send (0 = infinite)"
     )
@@ -111,11 +95,21 @@ def main() -> int:
         default=1.0,
         help="Interval between pings (seconds)"
     )
+    parser.add_argument(
+        "--quiet",
+        action="store_true",
+        help="Only print the summary, not a line per ping"
+    )
+    parser.add_argument(
+        "--debug",
+        action="store_true",
+        help="Print a traceback on unexpected errors"
+    )
     args = parser.parse_args()
 
     demo = PingDemo()
     return demo.run(
-        args.command_endpoint, args.status_endpoint, args.hand_streaming_endpoint, args.wrist_streaming_endpoint, args.count, args.interval
+        *resolve_endpoints(parser, args), args.count, args.interval, args.quiet, args.debug
     )
 
 
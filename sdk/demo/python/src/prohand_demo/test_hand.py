@@ -8,15 +8,30 @@ Tests each joint of each finger individually with cyclic motion.
 import sys
 import argparse
 import time
+import math
+from array import array
 from .utils import DemoBase
 
 
+_DEG_TO_RAD = math.pi / 180.0
+
+
 class TestHandDemo(DemoBase):
     """Individual joint testing demo."""
 
     def __init__(self):
         super().__init__("ProHand Test Hand - Individual Joint Testing")
 
+    @staticmethod
+    def _wait_until(deadline: float) -> float:
+        """Sleep until a monotonic deadline and return it, or return now if it
+        already passed so a long stall does not trigger a burst of sends."""
+        remaining = deadline - time.monotonic()
+        if remaining > 0:
+            time.sleep(remaining)
+            return deadline
+        return time.monotonic()
+
     def run(
         self,
         command_endpoint: str,
@@ -76,7 +91,26 @@ class TestHandDemo(DemoBase):
             zero_wrist_positions = [0.0, 0.0]  # 2 wrist joints
             client.send_hand_streams(zero_positions, 0.45)
             client.send_wrist_streams(zero_wrist_positions)
-            time.sleep(1.0)
+            # Moves are paced on a fixed monotonic grid so send cadence does
+            # not drift with the time spent sending
+            deadline = self._wait_until(time.monotonic() + 1.0)
+
+            # Joint test ranges in radians, computed once: metacarpal (abduction)
+            # swings -30..30 deg on the fingers, flexion joints 0..90 deg
+            rad_ranges = [
+                [
+                    (-30.0 * _DEG_TO_RAD, 30.0 * _DEG_TO_RAD) if j == 0 and finger != "thumb"
+                    else (0.0, 90.0 * _DEG_TO_RAD)
+                    for j in range(4)
+                ]
+                for finger in fingers
+            ]
+            preflex_rad = 90.0 * _DEG_TO_RAD
+
+            # One float32 command buffer reused for every joint (the SDK passes
+            # it to the library without converting); only the joint under
+            # test (and a pre-flexed intermediate) ever differ from zero
+            positions = array("f", [0.0]) * 20
 
             # Test each joint of each finger
             # Joint layout: thumb[0-3], index[4-7], middle[8-11], ring[12-15], pinky[16-19]
@@ -85,44 +119,40 @@ class TestHandDemo(DemoBase):
                     joint_idx = finger_idx * 4 + j
                     self.section(f"{finger} - {joint_names[j]} (joint {joint_idx})")
 
-                    # Determine range based on joint and finger
-                    if j == 0 and finger != "thumb":
-                        # Metacarpal (abduction)
-                        min_deg, max_deg = -30.0, 30.0
-                    else:
-                        # Flexion joints
-                        min_deg, max_deg = 0.0, 90.0
+                    min_rad, max_rad = rad_ranges[finger_idx][j]
+
+                    # The wrist stays at zero for the whole test, so its command
+                    # is resent once per joint rather than with every hand frame;
+                    # the resend also covers a first message dropped on the
+                    # separate wrist PUB socket (ZMQ slow joiner)
+                    client.send_wrist_streams(zero_wrist_positions)
 
-                    import math
-                    min_rad = math.radians(min_deg)
-                    max_rad = math.radians(max_deg)
+                    # For distal joint (j==3), pre-flex intermediate
+                    preflex = j == 3 and finger != "thumb"
+                    if preflex:
+                        positions[joint_idx - 1] = preflex_rad
 
                     # Run cycles (use streaming for high-frequency commands)
                     for cycle in range(cycles):
-                        # Start with all zero (20 positions: 5 fingers × 4 joints)
-                        positions = [0.0] * 20
-
-                        # For distal joint (j==3), pre-flex intermediate
-                        if j == 3 and finger != "thumb":
-                            positions[joint_idx - 1] = math.radians(90.0)
-
                         # Move to max position (use streaming for high-frequency control)
                         positions[joint_idx] = max_rad
                         client.send_hand_streams(positions, 0.45)
-                        client.send_wrist_streams(zero_wrist_positions)
-                        time.sleep(delay)
+                        deadline = self._wait_until(deadline + delay)
 
                         # Move to min position
                         positions[joint_idx] = min_rad
                         client.send_hand_streams(positions, 0.45)
-                        client.send_wrist_streams(zero_wrist_positions)
-                        time.sleep(delay)
+                        deadline = self._wait_until(deadline + delay)
+
+                    # Back to all zero before the next joint
+                    positions[joint_idx] = 0.0
+                    if preflex:
+                        positions[joint_idx - 1] = 0.0
 
             # Return to zero (use streaming mode)
             self.section("Returning to zero position...")
             client.send_hand_streams(zero_positions, 0.45)
-            client.send_wrist_streams(zero_wrist_positions)
-            time.sleep(0.5)
+            self._wait_until(deadline + 0.5)
 
             # Disable streaming mode
             self.section("Disabling streaming mode...")
@@ -9,10 +9,17 @@ import json
 import math
 import socket
 import time
+from array import array
 from typing import Any, Optional
 
 from .utils import DemoBase
 
+try:
+    # Optional faster parser; loads() takes the raw packet bytes like json
+    import orjson as _json
+except ImportError:
+    _json = json
+
 
 class GloveDataMapper:
     """Maps glove data from UDP JSON to ProHand command format."""
@@ -52,82 +59,161 @@ class GloveDataMapper:
         if self.hand not in {"left", "right"}:
             raise ValueError("hand must be 'left' or 'right'")
         self.joint_map = self.LEFT_JOINT_MAP if self.hand == "left" else self.RIGHT_JOINT_MAP
+        # Only this hand's joint parameters are kept while extracting
+        self._allowed = frozenset(name for joints in self.joint_map.values() for name in joints)
+        # Key paths to the "Parameter" lists, learned from the first packet
+        self._param_paths: tuple[tuple[Any, ...], ...] = ()
+        self._coeffs = self._build_coeffs()
+
+    def _build_coeffs(self) -> list[tuple[str, int, float, float, float, float]]:
+        """Fold clamp range, normalisation, inversion and deg->rad into one
+        (joint, slot, in_lo, in_hi, scale, bias) entry per joint, so that
+        angle_rad = clamp(raw, in_lo, in_hi) * scale + bias."""
+        coeffs = []
+        slot = 0
+        for finger_name, joint_names in self.joint_map.items():
+            input_ranges = self.JOINT_RANGES_DEG.get(finger_name, [(-180.0, 180.0)] * 4)
+            output_ranges = self.ROBOT_RANGES_DEG.get(finger_name, [(-180.0, 180.0)] * 4)
+            for i, joint in enumerate(joint_names):
+                in_lo, in_hi = input_ranges[i] if i < len(input_ranges) else (-180.0, 180.0)
+                out_lo, out_hi = output_ranges[i] if i < len(output_ranges) else (-180.0, 180.0)
+                k = (out_hi - out_lo) / (in_hi - in_lo) if in_hi != in_lo else 0.0
+                if finger_name == "thumb" and i == 0:
+                    scale, bias = k, out_lo - in_lo * k
+                else:
+                    # Inverted: glove flexion is negative, robot flexion positive
+                    scale, bias = -k, out_hi + in_lo * k
+                coeffs.append((
+                    joint, slot, float(in_lo), float(in_hi),
+                    math.radians(scale), math.radians(bias),
+                ))
+                slot += 1
+        return coeffs
 
-    def parse_udp_message(self, data: bytes) -> Optional[dict[str, Any]]:
+    def parse_udp_message(self, data: bytes, size: Optional[int] = None) -> Optional[dict[str, Any]]:
+        """Parse the first JSON object in data[:size] (bytes or bytearray)."""
         try:
-            msg = data.decode("utf-8")
-            start = msg.find('{"')
+            end = len(data) if size is None else size
+            start = data.find(b'{"', 0, end)
             if start == -1:
                 return None
-            brace = 0
-            end = -1
-            for i, ch in enumerate(msg[start:], start):
-                if ch == "{":
-                    brace += 1
-                elif ch == "}":
-                    brace -= 1
-                    if brace == 0:
-                        end = i + 1
-                        break
-            if end == -1:
-                return None
-            return json.loads(msg[start:end])
+            # Find the brace closing the first object: step between closing
+            # braces and count the opening ones in C rather than per byte
+            opened = 0
+            closed = 0
+            pos = start
+            while True:
+                close = data.find(b"}", pos, end)
+                if close == -1:
+                    return None
+                opened += data.count(b"{", pos, close)
+                closed += 1
+                pos = close + 1
+                if closed == opened:
+                    break
+            return _json.loads(data[start:pos])
         except Exception:
             return None
 
     def extract_parameters(self, message_dict: dict) -> dict[str, float]:
+        """Collect Name -> Value for this hand's joints from the Parameter lists.
+
+        The glove driver sends the same JSON layout every packet, so the key
+        paths found by the full tree walk are cached and indexed directly;
+        any packet that does not fit them falls back to the walk.
+        """
+        paths = self._param_paths
+        if paths:
+            try:
+                params: dict[str, float] = {}
+                allowed = self._allowed
+                for path in paths:
+                    node = message_dict
+                    for key in path:
+                        node = node[key]
+                    for param in node:
+                        name = param["Name"]
+                        if name in allowed:
+                            params[name] = float(param["Value"])
+                return params
+            except (KeyError, IndexError, TypeError):
+                pass
+        return self._extract_parameters_slow(message_dict)
+
+    def _extract_parameters_slow(self, message_dict: dict) -> dict[str, float]:
         params: dict[str, float] = {}
+        paths: list[tuple[Any, ...]] = []
+        allowed = self._allowed
 
-        def visit(obj: Any) -> None:
-            if isinstance(obj, dict):
-                if "Parameter" in obj and isinstance(obj["Parameter"], list):
-                    for param in obj["Parameter"]:
-                        if isinstance(param, dict) and "Name" in param and "Value" in param:
+        # json/orjson build exactly dict and list (never subclasses), so the
+        # type checks are identity compares rather than isinstance()
+        def visit(obj: Any, path: tuple[Any, ...]) -> None:
+            t = type(obj)
+            if t is dict:
+                plist = obj.get("Parameter")
+                if type(plist) is list:
+                    paths.append(path + ("Parameter",))
+                    for param in plist:
+                        if type(param) is dict and "Name" in param and "Value" in param:
                             name = param["Name"]
-                            val = param["Value"]
-                            if self.hand == "left":
-                                if name.startswith("l") or not name.startswith("r"):
-                                    params[name] = float(val)
-                            else:
-                                if name.startswith("r") or not name.startswith("l"):
-                                    params[name] = float(val)
+                            if name in allowed:
+                                params[name] = float(param["Value"])
                 else:
-                    for value in obj.values():
-                        visit(value)
-            elif isinstance(obj, list):
-                for item in obj:
-                    visit(item)
+                    for key, value in obj.items():
+                        visit(value, path + (key,))
+            elif t is list:
+                for index, item in enumerate(obj):
+                    visit(item, path + (index,))
 
-        visit(message_dict)
+        visit(message_dict, ())
+        if paths:
+            self._param_paths = tuple(paths)
         return params
 
     @staticmethod
     def degrees_to_radians(deg: float) -> float:
         return math.radians(deg)
 
+    def map_to_hand_buffer(self, params: dict[str, float], out) -> None:
+        """Write the 20 hand joint angles (radians) for params into out.
+
+        out is any mutable sequence of 20 floats, e.g. array('f'); joints
+        missing from params are set to 0.0. Order: thumb[0-3], index[4-7],
+        middle[8-11], ring[12-15], pinky[16-19].
+        """
+        # Plain loop over the precomputed table: at 20 joints this stays cheaper
+        # than handing the data to a compiled kernel (numpy/numba boxing)
+        for joint, slot, lo, hi, scale, bias in self._coeffs:
+            v = params.get(joint)
+            if v is None:
+                out[slot] = 0.0
+                continue
+            if v < lo:
+                v = lo
+            elif v > hi:
+                v = hi
+            out[slot] = v * scale + bias
+
     def map_to_hand_command(self, params: dict[str, float]) -> dict[str, list[float]]:
-        cmd: dict[str, list[float]] = {}
-        for finger_name, joint_names in self.joint_map.items():
-            angles: list[float] = []
-            input_ranges = self.JOINT_RANGES_DEG.get(finger_name, [(-180.0, 180.0)] * 4)
-            output_ranges = self.ROBOT_RANGES_DEG.get(finger_name, [(-180.0, 180.0)] * 4)
-            for i, joint in enumerate(joint_names):
-                if joint in params:
-                    raw = float(params[joint])
-                    min_deg, max_deg = input_ranges[i] if i < len(input_ranges) else (-180.0, 180.0)
-                    clamped = max(min_deg, min(max_deg, raw))
-                    out_min, out_max = output_ranges[i] if i < len(output_ranges) else (-180.0, 180.0)
-                    s01 = (clamped - min_deg) / (max_deg - min_deg) if max_deg != min_deg else 0.0
-                    if not (finger_name == "thumb" and i == 0):
-                        s01 = 1.0 - s01
-                    angle_deg = out_min + s01 * (out_max - out_min)
-                    angles.append(self.degrees_to_radians(angle_deg))
-                else:
-                    angles.append(0.0)
-            cmd[finger_name] = angles
+        flat = [0.0] * 20
+        self.map_to_hand_buffer(params, flat)
+        cmd: dict[str, list[float]] = {
+            finger_name: flat[k * 4:(k + 1) * 4] for k, finger_name in enumerate(self.joint_map)
+        }
         cmd["wrist"] = [0.0, 0.0]
         return cmd
 
+    def process_udp_data_into(self, data: bytes, out, size: Optional[int] = None) -> bool:
+        """Map a UDP packet (data[:size]) straight into a 20-joint buffer; False if unusable."""
+        msg = self.parse_udp_message(data, size)
+        if msg is None:
+            return False
+        params = self.extract_parameters(msg)
+        if not params:
+            return False
+        self.map_to_hand_buffer(params, out)
+        return True
+
     def process_udp_data(self, data: bytes) -> Optional[dict[str, list[float]]]:
         msg = self.parse_udp_message(data)
         if msg is None:
@@ -143,6 +229,38 @@ class UdcapDemo(DemoBase):
 
     def __init__(self):
         super().__init__("UDCAP → ProHand Demo")
+        # Datagrams are received into one reusable buffer; _rx_len is the
+        # size of the newest unprocessed packet in it (0: none pending)
+        self._rx_buf = bytearray(4096)
+        self._rx_len = 0
+        self._rx_event = asyncio.Event()
+        self._idle_handle: Optional[asyncio.TimerHandle] = None
+        self._udp_error_reported = False
+
+    def _on_udp(self, sock: socket.socket) -> None:
+        """Reader callback: drain the socket, keep only the newest packet."""
+        buf = self._rx_buf
+        n = 0
+        try:
+            while True:
+                n = sock.recv_into(buf)
+        except BlockingIOError:
+            pass
+        except OSError as e:
+            # e.g. ICMP port-unreachable surfacing as ConnectionResetError on
+            # Windows; it can repeat on every wake-up, so report it only once
+            if not self._udp_error_reported:
+                self._udp_error_reported = True
+                self.warning(f"UDP receive error: {e}")
+            return
+        if n:
+            self._rx_len = n
+            self._rx_event.set()
+
+    def _on_idle_tick(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Periodic timer: wake run() without a packet so it can check for stale input."""
+        self._rx_event.set()
+        self._idle_handle = loop.call_later(0.5, self._on_idle_tick, loop)
 
     async def run(
         self,
@@ -165,6 +283,8 @@ class UdcapDemo(DemoBase):
         loop = asyncio.get_running_loop()
         sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
         sock.setblocking(False)
+        # Room for producer bursts between drains (the kernel caps this at rmem_max)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 1 << 20)
         sock.bind((udp_host, udp_port))
 
         try:
@@ -178,37 +298,52 @@ class UdcapDemo(DemoBase):
             return 1
 
         self.info(f"Listening UDP on {udp_host}:{udp_port}, streaming to ProHand.")
-        publish_interval = 1.0 / publish_rate
-        last_publish = time.monotonic()
-        last_rx = time.monotonic()
+        # Rate gate and stale-input check in integer nanoseconds
+        publish_interval_ns = int(round(1e9 / publish_rate))
+        stale_ns = 3_000_000_000
+        last_publish_ns = last_rx_ns = time.monotonic_ns()
+        # Joint angles are mapped in place into one float32 buffer, which the
+        # SDK passes to the library without converting
+        flat = array("f", [0.0]) * 20
+
+        # Packets are read in a selector callback rather than one
+        # loop.sock_recv() future per datagram, and the idle check runs off
+        # one periodic timer rather than a timeout wrapped around every wait
+        rx_event = self._rx_event
+        loop.add_reader(sock.fileno(), self._on_udp, sock)
+        self._idle_handle = loop.call_later(0.5, self._on_idle_tick, loop)
+
+        # Hot-path callables bound to locals once, outside the receive loop
+        monotonic_ns = time.monotonic_ns
+        wait_rx = rx_event.wait
+        clear_rx = rx_event.clear
+        rx_buf = self._rx_buf
+        process = mapper.process_udp_data_into
+        send_hand = client.send_hand_streams
 
         try:
             while True:
-                try:
-                    data = await asyncio.wait_for(loop.sock_recv(sock, 4096), timeout=0.01)
-                    last_rx = time.monotonic()
-                    cmd = mapper.process_udp_data(data)
-                    if cmd:
-                        flat: list[float] = (
-                            cmd["thumb"]
-                            + cmd["index"]
-                            + cmd["middle"]
-                            + cmd["ring"]
-                            + cmd["pinky"]
-                        )
-                        now = time.monotonic()
-                        if now - last_publish >= publish_interval:
-                            client.send_hand_streams(flat, torque)
-                            last_publish = now
-                except asyncio.TimeoutError:
-                    now = time.monotonic()
-                    if now - last_rx > 3.0:
+                await wait_rx()
+                clear_rx()
+                size = self._rx_len
+                now_ns = monotonic_ns()
+                if not size:
+                    # Woken by the idle timer with no packet pending
+                    if now_ns - last_rx_ns > stale_ns:
                         self.warning("No UDP data received in last 3s; check driver")
-                        last_rx = now
+                        last_rx_ns = now_ns
                     continue
+                self._rx_len = 0
+                last_rx_ns = now_ns
+                if process(rx_buf, flat, size):
+                    if now_ns - last_publish_ns >= publish_interval_ns:
+                        send_hand(flat, torque)
+                        last_publish_ns = now_ns
         except KeyboardInterrupt:
             self.info("Interrupted by user. Stopping...")
         finally:
+            self._idle_handle.cancel()
+            loop.remove_reader(sock.fileno())
             sock.close()
             try:
                 client.set_streaming_mode(False)
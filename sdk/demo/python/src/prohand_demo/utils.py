@@ -2,13 +2,18 @@
 Utility classes and functions for ProHand FFI demos
 """
 
+import os
 import sys
 from pathlib import Path
+from typing import Optional
 
 
 class DemoBase:
     """Base class for demo applications with common formatting utilities."""
     
+    # SDK module, resolved once per process and shared by all demos
+    _sdk = None
+    
     def __init__(self, title: str):
         self.title = title
         # Import SDK from relative path
@@ -16,6 +21,9 @@ class DemoBase:
     
     def _load_sdk(self):
         """Load the ProHand SDK from the prohand_sdk directory."""
+        if DemoBase._sdk is not None:
+            return DemoBase._sdk
+        
         # Add SDK to Python path if not already there
         sdk_path = Path(__file__).parent.parent.parent.parent.parent / "prohand_sdk" / "python"
         if sdk_path.exists() and str(sdk_path) not in sys.path:
@@ -23,12 +31,14 @@ class DemoBase:
         
         try:
             import prohand_sdk
-            return prohand_sdk
         except ImportError as e:
             raise RuntimeError(
                 f"Failed to import prohand_sdk: {e}\n"
                 f"Expected SDK at: {sdk_path}\n"
             )
+        
+        DemoBase._sdk = prohand_sdk
+        return prohand_sdk
     
     def banner(self, width: int = 60):
         """Print a banner with the demo title."""
@@ -55,4 +65,31 @@ class DemoBase:
     def warning(self, message: str):
         """Print a warning message."""
         print(f"⚠️  {message}")
-
+    
+    def configure_scheduling(self, cpu: Optional[int], realtime: bool) -> None:
+        """
+        Pin the process to a CPU and/or switch it to SCHED_FIFO
+        
+        Reduces scheduler jitter in fixed-rate publish loops. Linux only;
+        SCHED_FIFO needs CAP_SYS_NICE (or root). Failures are reported as
+        warnings and the demo continues with default scheduling.
+        """
+        if cpu is not None:
+            if not hasattr(os, "sched_setaffinity"):
+                self.warning("CPU pinning is not supported on this platform")
+            else:
+                try:
+                    os.sched_setaffinity(0, {cpu})
+                    self.info(f"Pinned to CPU {cpu}")
+                except (OSError, ValueError, OverflowError) as e:
+                    self.warning(f"Could not pin to CPU {cpu}: {e}")
+        
+        if realtime:
+            if not hasattr(os, "sched_setscheduler"):
+                self.warning("SCHED_FIFO is not supported on this platform")
+            else:
+                try:
+                    os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(10))
+                    self.info("Using SCHED_FIFO (priority 10)")
+                except OSError as e:
+                    self.warning(f"Could not enable SCHED_FIFO (needs CAP_SYS_NICE): {e}")
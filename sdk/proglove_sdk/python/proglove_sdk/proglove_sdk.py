@@ -41,11 +41,13 @@ Requirements:
 import ctypes
 import os
 import sys
+import time
+import weakref
 from ctypes import (
     POINTER, c_char_p, c_int, c_uint, c_uint8,
-    Structure, pointer
+    Structure, byref
 )
-from typing import List, Optional
+from typing import Dict, List, Optional
 from dataclasses import dataclass
 from enum import IntEnum
 
@@ -62,14 +64,14 @@ def _find_library():
         return env_path
 
     # Determine library name based on platform and architecture
-    import platform
-    machine = platform.machine()
-
     if sys.platform == 'darwin':
         lib_name = 'libproglove_client_sdk.dylib'
     elif sys.platform == 'win32':
         lib_name = 'proglove_client_sdk.dll'
     elif sys.platform.startswith('linux'):
+        # os.uname() is what platform.machine() reads on POSIX; calling it
+        # directly keeps the platform module out of the SDK import
+        machine = os.uname().machine
         # On aarch64 (Jetson Nano), use the _aarch64 variant
         if machine == 'aarch64':
             lib_name = 'libproglove_client_sdk_aarch64.so'
@@ -108,7 +110,8 @@ def _find_library():
 
 # Load the library
 _lib_path = _find_library()
-_lib = ctypes.CDLL(_lib_path)
+# errno / GetLastError() are not consulted, so neither is saved per call
+_lib = ctypes.CDLL(_lib_path, use_errno=False, use_last_error=False)
 
 
 # ============================================================================
@@ -210,41 +213,121 @@ class UsbDevice:
     display_name: str
 
 
-@dataclass
+# Taxel segment names in struct order, taken from the struct definition so
+# the layout, slices and TactileStatus attributes below follow it
+TACTILE_SEGMENTS = tuple(
+    name for name, field_type in ProGloveTactileStatus._fields_
+    if issubclass(field_type, ctypes.Array)
+)
+
+# Flat taxel layout: the segments are packed back to back in
+# ProGloveTactileStatus, so all taxels form one contiguous uint8 block of
+# TAXELS_TOTAL bytes starting TAXELS_OFFSET bytes into the struct, and each
+# segment is a constant slice of that block
+TAXELS_TOTAL = 100
+TAXELS_OFFSET = ProGloveTactileStatus.t_dip.offset
+TACTILE_SEGMENT_SLICES: Dict[str, slice] = {}
+_next = 0
+for _name in TACTILE_SEGMENTS:
+    _field = getattr(ProGloveTactileStatus, _name)
+    if _field.offset != TAXELS_OFFSET + _next:
+        raise RuntimeError(f"ProGloveTactileStatus.{_name} is not contiguous with the previous segment")
+    TACTILE_SEGMENT_SLICES[_name] = slice(_next, _next + _field.size)
+    _next += _field.size
+if _next != TAXELS_TOTAL:
+    raise RuntimeError(f"ProGloveTactileStatus holds {_next} taxels, expected {TAXELS_TOTAL}")
+del _next, _name, _field
+
+
+def _segment_view(name: str) -> property:
+    """Property returning a uint8 memoryview of one taxel segment"""
+    segment = TACTILE_SEGMENT_SLICES[name]
+
+    def get(self) -> memoryview:
+        return self._taxels[segment]
+    return property(get, doc=f"{name} taxels as a uint8 memoryview (no copy)")
+
+
 class TactileStatus:
     """
     Python-friendly tactile status from glove sensors (segment-based)
 
     Tactile data is organized by joint segment (DIP/MCP/PIP) for each finger.
     Values are 0-255 where higher values indicate more pressure.
+
+    The received ProGloveTactileStatus is wrapped rather than converted:
+    each segment attribute (t_dip ... lower_palm, named in TACTILE_SEGMENTS
+    and generated from the struct fields) is a memoryview over the struct, created only
+    when accessed, so indexing, len(), iteration and bytes() need no
+    per-taxel Python objects. Use to_lists() for plain lists, or
+    flat_taxels() for all 100 taxels as one view (see TACTILE_SEGMENT_SLICES).
     """
-    is_valid: bool
-    timestamp: int
-    uid: int
-    # Thumb segments
-    t_dip: List[int]
-    t_mcp: List[int]
-    t_pip: List[int]
-    # Index segments
-    i_dip: List[int]
-    i_mcp: List[int]
-    i_pip: List[int]
-    # Middle segments
-    m_dip: List[int]
-    m_mcp: List[int]
-    m_pip: List[int]
-    # Ring segments
-    r_dip: List[int]
-    r_mcp: List[int]
-    r_pip: List[int]
-    # Pinky segments
-    p_dip: List[int]
-    p_mcp: List[int]
-    p_pip: List[int]
-    # Palm segments
-    upper_palm: List[int]
-    middle_palm: List[int]
-    lower_palm: List[int]
+    __slots__ = ("_raw", "_taxels")
+
+    def __init__(self, raw: ProGloveTactileStatus):
+        self._raw = raw
+        self._taxels = memoryview(raw).cast("B")[TAXELS_OFFSET:TAXELS_OFFSET + TAXELS_TOTAL]
+
+    @property
+    def is_valid(self) -> bool:
+        return bool(self._raw.is_valid)
+
+    @property
+    def timestamp(self) -> int:
+        return self._raw.timestamp
+
+    @property
+    def uid(self) -> int:
+        return self._raw.uid
+
+    def copy(self) -> "TactileStatus":
+        """Return a status backed by its own copy of the struct (one 112-byte memcpy)"""
+        return TactileStatus(ProGloveTactileStatus.from_buffer_copy(self._raw))
+
+    @property
+    def taxels(self) -> memoryview:
+        """All 100 taxels as one contiguous uint8 memoryview (no copy)"""
+        return self._taxels
+
+    def flat_taxels(self) -> memoryview:
+        """Return all 100 taxels as one contiguous uint8 memoryview (no copy)"""
+        return self._taxels
+
+    def segment(self, finger: str, part: str) -> memoryview:
+        """
+        Return one segment of taxels as a uint8 memoryview (no copy)
+
+        Args:
+            finger: "t", "i", "m", "r" or "p" for fingers; "upper", "middle"
+                or "lower" for the palm
+            part: "dip", "mcp" or "pip" for fingers; "palm" for the palm
+
+        Raises:
+            KeyError: If there is no such segment
+        """
+        return self._taxels[TACTILE_SEGMENT_SLICES[f"{finger}_{part}"]]
+
+    def segments(self) -> Dict[str, memoryview]:
+        """Return all segments as {name: uint8 memoryview}, in struct order"""
+        taxels = self._taxels
+        return {name: taxels[segment] for name, segment in TACTILE_SEGMENT_SLICES.items()}
+
+    def to_lists(self) -> Dict[str, List[int]]:
+        """Return all segments as {name: list of ints}, in struct order"""
+        taxels = self._taxels.tolist()
+        return {name: taxels[segment] for name, segment in TACTILE_SEGMENT_SLICES.items()}
+
+    def __repr__(self) -> str:
+        return (
+            f"TactileStatus(is_valid={self.is_valid}, "
+            f"timestamp={self.timestamp}, uid={self.uid})"
+        )
+
+
+# Segment attributes (t_dip ... lower_palm), one per struct segment field
+for _name in TACTILE_SEGMENTS:
+    setattr(TactileStatus, _name, _segment_view(_name))
+del _name
 
 
 # ============================================================================
@@ -269,6 +352,11 @@ _lib.proglove_send_ping.restype = c_int
 _lib.proglove_try_recv_status.argtypes = [POINTER(ProGloveClientHandle), POINTER(ProGloveTactileStatus)]
 _lib.proglove_try_recv_status.restype = c_int
 
+# Function pointers used in polling loops, bound once so each call skips the
+# CDLL attribute lookup
+_try_recv_status = _lib.proglove_try_recv_status
+_send_ping = _lib.proglove_send_ping
+
 # USB discovery
 _lib.proglove_discover_usb_devices.argtypes = [POINTER(ProGloveUsbDeviceInfo), c_int]
 _lib.proglove_discover_usb_devices.restype = c_int
@@ -301,22 +389,25 @@ class InvalidArgumentError(ProGloveError):
     pass
 
 
+# Error result code -> (exception class, message)
+_ERRORS = {
+    ProGloveResult.ERROR_NULL: (ProGloveError, "Null pointer error"),
+    ProGloveResult.ERROR_CONNECTION: (ConnectionError, "Connection error"),
+    ProGloveResult.ERROR_INVALID_ARGUMENT: (InvalidArgumentError, "Invalid argument"),
+    ProGloveResult.ERROR_NOT_CONNECTED: (ConnectionError, "Not connected"),
+    ProGloveResult.ERROR_UNSUPPORTED: (ProGloveError, "Unsupported operation"),
+}
+
+
 def _check_result(result: int, operation: str = "operation"):
     """Check result code and raise exception if error"""
-    if result == ProGloveResult.SUCCESS:
+    if result == 0:  # ProGloveResult.SUCCESS, compared as a plain int
         return
-    elif result == ProGloveResult.ERROR_NULL:
-        raise ProGloveError(f"{operation}: Null pointer error")
-    elif result == ProGloveResult.ERROR_CONNECTION:
-        raise ConnectionError(f"{operation}: Connection error")
-    elif result == ProGloveResult.ERROR_INVALID_ARGUMENT:
-        raise InvalidArgumentError(f"{operation}: Invalid argument")
-    elif result == ProGloveResult.ERROR_NOT_CONNECTED:
-        raise ConnectionError(f"{operation}: Not connected")
-    elif result == ProGloveResult.ERROR_UNSUPPORTED:
-        raise ProGloveError(f"{operation}: Unsupported operation")
-    else:
+    error = _ERRORS.get(result)
+    if error is None:
         raise ProGloveError(f"{operation}: Unknown error ({result})")
+    exc_type, message = error
+    raise exc_type(f"{operation}: {message}")
 
 
 # ============================================================================
@@ -356,10 +447,13 @@ class ProGloveClient:
             raise ConnectionError(f"Failed to create ProGlove client for endpoint: {status_endpoint}")
 
         self._closed = False
-
-    def __del__(self):
-        """Clean up resources"""
-        self.close()
+        # Destroys the native client exactly once: on close(), when the
+        # client is garbage collected, or at interpreter exit
+        self._finalizer = weakref.finalize(self, _lib.proglove_client_destroy, self._handle)
+        # Receive buffer reused across empty polls; replaced only once a
+        # received status has been handed out with it
+        self._status_buf = ProGloveTactileStatus()
+        self._status_ref = byref(self._status_buf)
 
     def __enter__(self):
         """Context manager entry"""
@@ -371,8 +465,8 @@ class ProGloveClient:
 
     def close(self):
         """Close the client and free resources"""
-        if not self._closed and self._handle:
-            _lib.proglove_client_destroy(self._handle)
+        if not self._closed:
+            self._finalizer()
             self._handle = None
             self._closed = True
 
@@ -382,6 +476,29 @@ class ProGloveClient:
             return False
         return bool(_lib.proglove_client_is_connected(self._handle))
 
+    def wait_for_connection(self, timeout: float = 2.0, poll_interval: float = 0.005) -> bool:
+        """
+        Wait for the background connection to be established
+
+        The native library connects asynchronously and offers no completion
+        callback, so this checks is_connected() every poll_interval seconds
+        and returns as soon as it reports True.
+
+        Args:
+            timeout: Maximum time to wait in seconds (default: 2.0)
+            poll_interval: How often to check the connection in seconds (default: 0.005)
+
+        Returns:
+            True if connected, False if timeout
+        """
+        deadline = time.monotonic() + timeout
+        while not self.is_connected():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            time.sleep(min(poll_interval, remaining))
+        return True
+
     # ========================================================================
     # COMMAND METHODS
     # ========================================================================
@@ -398,7 +515,7 @@ class ProGloveClient:
         """
         if self._closed:
             raise ConnectionError("Client is closed")
-        result = _lib.proglove_send_ping(self._handle)
+        result = _send_ping(self._handle)
         # 0 means success (PROGLOVE_SUCCESS), negative means error
         if result < 0:
             _check_result(result, "send_ping")
@@ -414,45 +531,172 @@ class ProGloveClient:
         Returns:
             TactileStatus if available, None otherwise
         """
-        c_status = ProGloveTactileStatus()
-        result = _lib.proglove_try_recv_status(self._handle, pointer(c_status))
+        result = _try_recv_status(self._handle, self._status_ref)
 
         if result > 0:
-            return TactileStatus(
-                is_valid=bool(c_status.is_valid),
-                timestamp=c_status.timestamp,
-                uid=c_status.uid,
-                # Thumb segments
-                t_dip=list(c_status.t_dip),
-                t_mcp=list(c_status.t_mcp),
-                t_pip=list(c_status.t_pip),
-                # Index segments
-                i_dip=list(c_status.i_dip),
-                i_mcp=list(c_status.i_mcp),
-                i_pip=list(c_status.i_pip),
-                # Middle segments
-                m_dip=list(c_status.m_dip),
-                m_mcp=list(c_status.m_mcp),
-                m_pip=list(c_status.m_pip),
-                # Ring segments
-                r_dip=list(c_status.r_dip),
-                r_mcp=list(c_status.r_mcp),
-                r_pip=list(c_status.r_pip),
-                # Pinky segments
-                p_dip=list(c_status.p_dip),
-                p_mcp=list(c_status.p_mcp),
-                p_pip=list(c_status.p_pip),
-                # Palm segments
-                upper_palm=list(c_status.upper_palm),
-                middle_palm=list(c_status.middle_palm),
-                lower_palm=list(c_status.lower_palm),
-            )
+            c_status = self._status_buf
+            self._status_buf = ProGloveTactileStatus()
+            self._status_ref = byref(self._status_buf)
+            return TactileStatus(c_status)
         elif result == 0:
             return None
         else:
             _check_result(result, "try_recv_status")
             return None  # Satisfy linter (never reached)
 
+    def recv_status_into(self, out, row: int = 0) -> bool:
+        """
+        Try to receive tactile status straight into a caller buffer (non-blocking)
+
+        Copies the 100 taxels, laid out as in TACTILE_SEGMENT_SLICES, into
+        row `row` of out, so recorders can fill a preallocated buffer without
+        a TactileStatus per sample. The header (is_valid, timestamp, uid) is
+        not copied; use try_recv_status() when it is needed.
+
+        Args:
+            out: Writable C-contiguous buffer of rows of TAXELS_TOTAL bytes
+                (e.g. bytearray, array('B') or a (N, 100) uint8 NumPy array)
+            row: Row index in out to write to (default: 0)
+
+        Returns:
+            True if a status was received into out, False if none was available
+
+        Raises:
+            IndexError: If row is outside out
+        """
+        # Check the destination first so a bad row does not consume a status
+        dest = memoryview(out).cast("B")
+        start = row * TAXELS_TOTAL
+        if row < 0 or start + TAXELS_TOTAL > dest.nbytes:
+            raise IndexError(f"row {row} is outside the output buffer")
+
+        result = _try_recv_status(self._handle, self._status_ref)
+        if result > 0:
+            # The receive buffer is not handed out, so it stays in use
+            dest[start:start + TAXELS_TOTAL] = memoryview(self._status_buf).cast("B")[
+                TAXELS_OFFSET:TAXELS_OFFSET + TAXELS_TOTAL
+            ]
+            return True
+        elif result == 0:
+            return False
+        else:
+            _check_result(result, "recv_status_into")
+            return False  # Satisfy linter (never reached)
+
+    def try_recv_status_many(self, max_count: int = 64) -> List[TactileStatus]:
+        """
+        Receive all queued tactile statuses, up to max_count (non-blocking)
+
+        Statuses are received into one preallocated array of structs, so
+        draining a backlog costs a single allocation rather than one per
+        sample. The native library has no batch receive, so this still makes
+        one proglove_try_recv_status call per status.
+
+        Args:
+            max_count: Maximum number of statuses to receive (default: 64)
+
+        Returns:
+            List of TactileStatus in arrival order (empty if none were queued)
+        """
+        statuses: List[TactileStatus] = []
+        if max_count <= 0:
+            return statuses
+        handle = self._handle
+        # Elements of a ctypes struct array are views into the array itself
+        for c_status in (ProGloveTactileStatus * max_count)():
+            result = _try_recv_status(handle, byref(c_status))
+            if result > 0:
+                statuses.append(TactileStatus(c_status))
+            elif result == 0:
+                break
+            else:
+                _check_result(result, "try_recv_status_many")
+        return statuses
+
+    def recv_status(
+        self, timeout_ms: int = 100, *, poll_interval: float = 0.001
+    ) -> Optional[TactileStatus]:
+        """
+        Receive tactile status, waiting up to timeout_ms for one to arrive
+
+        The native library only exposes a non-blocking receive, so between
+        empty polls the calling thread sleeps for poll_interval instead of
+        spinning. While no status arrives the thread wakes about
+        1 / poll_interval times a second (1000 at the default), so raise
+        poll_interval when that latency is not needed.
+
+        Args:
+            timeout_ms: Maximum time to wait in milliseconds (default: 100)
+            poll_interval: Keyword-only sleep between empty polls in seconds
+                (default: 0.001)
+
+        Returns:
+            TactileStatus if one arrived before the timeout, None otherwise
+        """
+        try_recv = self.try_recv_status
+        status = try_recv()
+        if status is not None or timeout_ms <= 0:
+            return status
+
+        # Bound once for the polling loop
+        monotonic = time.monotonic
+        sleep = time.sleep
+        deadline = monotonic() + timeout_ms / 1000.0
+        while True:
+            remaining = deadline - monotonic()
+            if remaining <= 0:
+                return None
+            sleep(poll_interval if poll_interval < remaining else remaining)
+            status = try_recv()
+            if status is not None:
+                return status
+
+    async def recv_status_async(
+        self, timeout_ms: Optional[int] = None, *, poll_interval: float = 0.001
+    ) -> Optional[TactileStatus]:
+        """
+        Receive tactile status without blocking the asyncio event loop
+
+        Like recv_status(), but the wait between empty polls is an
+        asyncio.sleep(), so one event loop can serve both gloves and a ProHand
+        client without a thread per client. The native library does not
+        expose its socket descriptor, so the status socket cannot be
+        registered with the loop directly. Each empty poll is one event-loop
+        wake-up, so with timeout_ms=None an idle glove costs about
+        1 / poll_interval wake-ups a second until a status arrives.
+
+        Args:
+            timeout_ms: Maximum time to wait in milliseconds (default: None, wait indefinitely)
+            poll_interval: Keyword-only sleep between empty polls in seconds
+                (default: 0.001)
+
+        Returns:
+            TactileStatus if one arrived before the timeout, None otherwise
+        """
+        import asyncio
+
+        try_recv = self.try_recv_status
+        status = try_recv()
+        if status is not None:
+            return status
+
+        # Bound once for the polling loop
+        monotonic = time.monotonic
+        sleep = asyncio.sleep
+        deadline = None if timeout_ms is None else monotonic() + timeout_ms / 1000.0
+        while True:
+            delay = poll_interval
+            if deadline is not None:
+                remaining = deadline - monotonic()
+                if remaining <= 0:
+                    return None
+                if remaining < delay:
+                    delay = remaining
+            await sleep(delay)
+            status = try_recv()
+            if status is not None:
+                return status
+
 
 # ============================================================================
 # MODULE-LEVEL FUNCTIONS
@@ -474,24 +718,25 @@ def discover_usb_devices(max_devices: int = 16) -> List[UsbDevice]:
     if count < 0:
         _check_result(count, "discover_usb_devices")
 
+    string_at = ctypes.string_at
+    free_string = _lib.proglove_free_string
     result = []
-    for i in range(count):
-        dev = devices_array[i]
-        # Convert mutable char pointers to Python strings
-        port = ""
-        display = ""
-        if dev.port_name:
-            port = ctypes.string_at(dev.port_name).decode('utf-8')
-        if dev.display_name:
-            display = ctypes.string_at(dev.display_name).decode('utf-8')
+    for dev in devices_array[:count]:
+        # Each field access builds a new pointer object, so read them once
+        port_ptr = dev.port_name
+        display_ptr = dev.display_name
+        try:
+            # Convert mutable char pointers to Python strings
+            port = string_at(port_ptr).decode('utf-8') if port_ptr else ""
+            display = string_at(display_ptr).decode('utf-8') if display_ptr else ""
+        finally:
+            # Free the strings allocated by Rust, even if decoding failed
+            if port_ptr:
+                free_string(port_ptr)
+            if display_ptr:
+                free_string(display_ptr)
         result.append(UsbDevice(port_name=port, display_name=display))
 
-        # Free the strings allocated by Rust
-        if dev.port_name:
-            _lib.proglove_free_string(dev.port_name)
-        if dev.display_name:
-            _lib.proglove_free_string(dev.display_name)
-
     return result
 
 
@@ -536,14 +781,19 @@ def _example():
             print(f"Warning: {e}")
 
         # Poll status for 2 seconds
-        import time
         print("Polling tactile status for 2 seconds...")
         samples_received = 0
-        start_time = time.time()
+        start_time = time.monotonic()
+        deadline = start_time + 2.0
         first_shown = False
 
-        while (time.time() - start_time) < 2.0:
-            status = client.try_recv_status()
+        while True:
+            # Wait for the next sample (or the end of the window) instead of
+            # polling on a fixed 1 ms sleep
+            remaining_ms = int((deadline - time.monotonic()) * 1000)
+            if remaining_ms <= 0:
+                break
+            status = client.recv_status(timeout_ms=remaining_ms)
             if status and status.is_valid:
                 samples_received += 1
                 if not first_shown:
@@ -552,13 +802,12 @@ def _example():
                     print(f"\nFirst sample received:")
                     print(f"  Timestamp: {status.timestamp}")
                     print(f"  UID: {status.uid}")
-                    print(f"  Thumb DIP ({len(status.t_dip)} taxels): {status.t_dip}")
-                    print(f"  Thumb MCP ({len(status.t_mcp)} taxels): {status.t_mcp[:5]}...")
-                    print(f"  Index DIP ({len(status.i_dip)} taxels): {status.i_dip}")
-                    print(f"  Upper Palm ({len(status.upper_palm)} taxels): {status.upper_palm[:5]}...")
-            time.sleep(0.001)  # Small sleep to avoid busy-waiting
+                    print(f"  Thumb DIP ({len(status.t_dip)} taxels): {list(status.t_dip)}")
+                    print(f"  Thumb MCP ({len(status.t_mcp)} taxels): {list(status.t_mcp[:5])}...")
+                    print(f"  Index DIP ({len(status.i_dip)} taxels): {list(status.i_dip)}")
+                    print(f"  Upper Palm ({len(status.upper_palm)} taxels): {list(status.upper_palm[:5])}...")
 
-        elapsed = time.time() - start_time
+        elapsed = time.monotonic() - start_time
         rate = samples_received / elapsed if elapsed > 0 else 0
         print(f"\nReceived {samples_received} samples in {elapsed:.2f}s ({rate:.1f} Hz)")
 
@@ -32,13 +32,17 @@ Usage:
     status = client.try_recv_status()
     if status and status.is_valid:
         if status.status_type == 1:
-            print(f"Rotary positions: {status.rotary_positions}")
+            print(f"Rotary positions: {list(status.rotary_positions)}")
         elif status.status_type == 2:
-            print(f"Linear positions: {status.linear_positions}")
+            print(f"Linear positions: {list(status.linear_positions)}")
 
     # Clean up
     client.close()
 
+Streaming sockets:
+    Socket options are fixed by the native library; see "Streaming Mode" in
+    the README for how to pace send_*_streams() so commands do not queue up.
+
 Requirements:
     - Place the compiled library (libprohand_client_sdk.so/.dylib/.dll) in:
       - ../lib/ relative to this script (recommended shared location)
@@ -49,10 +53,14 @@ Requirements:
 
 import ctypes
 import os
+import struct
 import sys
+import time
+import weakref
+from array import array
 from ctypes import (
     POINTER, c_char_p, c_int, c_float, c_uint16, c_uint64, c_bool,
-    Structure, pointer, cast
+    Structure, byref, cast
 )
 from typing import List, Optional, Tuple
 from dataclasses import dataclass
@@ -71,14 +79,14 @@ def _find_library():
         return env_path
     
     # Determine library name based on platform and architecture
-    import platform
-    machine = platform.machine()
-    
     if sys.platform == 'darwin':
         lib_name = 'libprohand_client_sdk.dylib'
     elif sys.platform == 'win32':
         lib_name = 'prohand_client_sdk.dll'
     elif sys.platform.startswith('linux'):
+        # os.uname() is what platform.machine() reads on POSIX; calling it
+        # directly keeps the platform module out of the SDK import
+        machine = os.uname().machine
         # On aarch64 (Jetson Nano), use the _aarch64 variant
         if machine == 'aarch64':
             lib_name = 'libprohand_client_sdk_aarch64.so'
@@ -147,8 +155,8 @@ class ProHandClientHandle(Structure):
 class ProHandUsbDeviceInfo(Structure):
     """USB device information"""
     _fields_ = [
-        ("port_name", c_char_p),
-        ("display_name", c_char_p),
+        ("port_name", POINTER(ctypes.c_char)),
+        ("display_name", POINTER(ctypes.c_char)),
     ]
 
 
@@ -171,11 +179,16 @@ class UsbDevice:
 
 @dataclass
 class HandStatus:
-    """Python-friendly hand status"""
+    """
+    Python-friendly hand status
+
+    Positions are float32 array.array copies of the native status, so they
+    can be wrapped without another copy (e.g. numpy.frombuffer).
+    """
     is_valid: bool
     status_type: int  # 0=unknown, 1=rotary, 2=linear
-    rotary_positions: List[float]
-    linear_positions: List[float]
+    rotary_positions: array  # 16 x float32
+    linear_positions: array  # 2 x float32
 
 
 # ============================================================================
@@ -280,7 +293,9 @@ _lib.prohand_discover_usb_devices.argtypes = [
 ]
 _lib.prohand_discover_usb_devices.restype = c_int
 
-_lib.prohand_free_string.argtypes = [c_char_p]
+# prohand_free_string expects the original char* returned by the library,
+# not a c_char_p copy of its contents
+_lib.prohand_free_string.argtypes = [POINTER(ctypes.c_char)]
 _lib.prohand_free_string.restype = None
 
 # Status polling
@@ -293,6 +308,15 @@ _lib.prohand_try_recv_status.restype = c_int
 _lib.prohand_is_running_state.argtypes = [POINTER(ProHandClientHandle)]
 _lib.prohand_is_running_state.restype = c_int
 
+# Function pointers used in streaming and polling loops, bound once so each
+# call skips the CDLL attribute lookup
+_send_rotary_streams = _lib.prohand_send_rotary_streams
+_send_linear_streams = _lib.prohand_send_linear_streams
+_send_wrist_streams = _lib.prohand_send_wrist_streams
+_send_hand_streams = _lib.prohand_send_hand_streams
+_try_recv_status = _lib.prohand_try_recv_status
+_is_running_state = _lib.prohand_is_running_state
+
 # Version
 _lib.prohand_get_version.argtypes = []
 _lib.prohand_get_version.restype = c_char_p
@@ -317,22 +341,74 @@ class InvalidArgumentError(ProHandError):
     pass
 
 
+# Error result code -> (exception class, message)
+_ERRORS = {
+    ProHandResult.ERROR_NULL: (ProHandError, "Null pointer error"),
+    ProHandResult.ERROR_CONNECTION: (ConnectionError, "Connection error"),
+    ProHandResult.ERROR_INVALID_ARGUMENT: (InvalidArgumentError, "Invalid argument"),
+    ProHandResult.ERROR_NOT_CONNECTED: (ConnectionError, "Not connected"),
+    ProHandResult.ERROR_UNSUPPORTED: (ProHandError, "Feature not supported (may be disabled in build)"),
+}
+
+
 def _check_result(result: int, operation: str = "operation"):
     """Check result code and raise exception if error"""
-    if result == ProHandResult.SUCCESS:
+    if result == 0:  # ProHandResult.SUCCESS, compared as a plain int
         return
-    elif result == ProHandResult.ERROR_NULL:
-        raise ProHandError(f"{operation}: Null pointer error")
-    elif result == ProHandResult.ERROR_CONNECTION:
-        raise ConnectionError(f"{operation}: Connection error")
-    elif result == ProHandResult.ERROR_INVALID_ARGUMENT:
-        raise InvalidArgumentError(f"{operation}: Invalid argument")
-    elif result == ProHandResult.ERROR_NOT_CONNECTED:
-        raise ConnectionError(f"{operation}: Not connected")
-    elif result == ProHandResult.ERROR_UNSUPPORTED:
-        raise ProHandError(f"{operation}: Feature not supported (may be disabled in build)")
-    else:
+    error = _ERRORS.get(result)
+    if error is None:
         raise ProHandError(f"{operation}: Unknown error ({result})")
+    exc_type, message = error
+    raise exc_type(f"{operation}: {message}")
+
+
+# Precompiled packers used to fill c_float send buffers
+_FLOAT_PACKERS = {n: struct.Struct(f"{n}f").pack_into for n in (2, 16, 20)}
+
+
+def _as_float_array(values, n: int, buf=None):
+    """
+    Return values as a (c_float * n) array, without copying when possible
+
+    ctypes c_float arrays and one-dimensional, contiguous float32 buffers
+    (array.array('f'), numpy float32 arrays, ...) are passed through to the
+    library as-is via the buffer protocol, so numpy is never imported here.
+    Anything else is packed into buf, a (c_float * n) array the caller
+    reuses across sends, or into a new array when buf is None.
+    """
+    if isinstance(values, ctypes.Array) and values._type_ is c_float:
+        return values
+    if not isinstance(values, (list, tuple)):
+        try:
+            view = memoryview(values)
+        except TypeError:
+            pass
+        else:
+            if view.format == 'f' and view.ndim == 1 and view.c_contiguous:
+                if view.readonly:
+                    return (c_float * n).from_buffer_copy(values)
+                return (c_float * n).from_buffer(values)
+    if buf is None:
+        buf = (c_float * n)()
+    _FLOAT_PACKERS[n](buf, 0, *values)
+    return buf
+
+
+def _endpoint_bytes(endpoint) -> bytes:
+    """Return a ZeroMQ endpoint as bytes, passing pre-encoded bytes through"""
+    if isinstance(endpoint, bytes):
+        return endpoint
+    return endpoint.encode('utf-8')
+
+
+def _to_hand_status(status_info: ProHandStatusInfo) -> HandStatus:
+    """Copy a native status struct into a HandStatus"""
+    return HandStatus(
+        is_valid=bool(status_info.is_valid),
+        status_type=int(status_info.status_type),
+        rotary_positions=array('f', bytes(status_info.rotary_positions)),
+        linear_positions=array('f', bytes(status_info.linear_positions))
+    )
 
 
 # ============================================================================
@@ -344,6 +420,12 @@ class ProHandClient:
     ProHand Client SDK - Python Interface
     
     This class provides a high-level Python interface to the ProHand device.
+
+    Each send_*_streams() method packs list/tuple inputs into its own buffer
+    on the client, reused across calls. Different streaming methods may run
+    on different threads, but one method must not be called concurrently on
+    the same client (the GIL is released during the native call, so a second
+    caller could overwrite the buffer before it is read).
     """
 
     def __init__(
@@ -361,14 +443,15 @@ class ProHandClient:
             status_endpoint: ZeroMQ endpoint for status (e.g., "tcp://127.0.0.1:5561")
             hand_streaming_endpoint: ZeroMQ endpoint for hand streaming (e.g., "tcp://127.0.0.1:5563")
             wrist_streaming_endpoint: ZeroMQ endpoint for wrist streaming (e.g., "tcp://127.0.0.1:5564")
+            Endpoints may also be given as UTF-8 bytes, which are used as-is.
 
         Raises:
             ConnectionError: If connection fails
         """
-        cmd_bytes = command_endpoint.encode('utf-8')
-        status_bytes = status_endpoint.encode('utf-8')
-        hand_streaming_bytes = hand_streaming_endpoint.encode('utf-8')
-        wrist_streaming_bytes = wrist_streaming_endpoint.encode('utf-8')
+        cmd_bytes = _endpoint_bytes(command_endpoint)
+        status_bytes = _endpoint_bytes(status_endpoint)
+        hand_streaming_bytes = _endpoint_bytes(hand_streaming_endpoint)
+        wrist_streaming_bytes = _endpoint_bytes(wrist_streaming_endpoint)
 
         self._handle = _lib.prohand_client_create(
             cmd_bytes, status_bytes, hand_streaming_bytes, wrist_streaming_bytes
@@ -378,10 +461,24 @@ class ProHandClient:
             raise ConnectionError("Failed to create ProHand client")
 
         self._closed = False
-
-    def __del__(self):
-        """Clean up resources"""
-        self.close()
+        # Destroys the native client exactly once: on close(), when the
+        # client is garbage collected, or at interpreter exit
+        self._finalizer = weakref.finalize(self, _lib.prohand_client_destroy, self._handle)
+
+        # One send buffer per streaming argument, reused for list/tuple inputs
+        # (see _as_float_array) so the streaming hot path does not allocate a
+        # ctypes array per call. Command-channel sends allocate per call.
+        self._rotary_pos = (c_float * 16)()
+        self._rotary_torque = (c_float * 16)()
+        self._linear_pos = (c_float * 2)()
+        self._linear_speed = (c_float * 2)()
+        self._wrist_pos = (c_float * 2)()
+        self._hand_pos = (c_float * 20)()
+
+        # Status struct reused by every try_recv_status() call; HandStatus
+        # copies the positions out, so nothing keeps a reference to it
+        self._status_buf = ProHandStatusInfo()
+        self._status_ref = byref(self._status_buf)
 
     def __enter__(self):
         """Context manager entry"""
@@ -393,8 +490,8 @@ class ProHandClient:
 
     def close(self):
         """Close the client and free resources"""
-        if not self._closed and self._handle:
-            _lib.prohand_client_destroy(self._handle)
+        if not self._closed:
+            self._finalizer()
             self._handle = None
             self._closed = True
 
@@ -402,7 +499,30 @@ class ProHandClient:
         """Check if connected to device"""
         if self._closed:
             return False
-        return bool(_lib.prohand_client_is_connected(self._handle))
+        return _lib.prohand_client_is_connected(self._handle) == 1
+
+    def wait_for_connection(self, timeout: float = 2.0, poll_interval: float = 0.005) -> bool:
+        """
+        Wait for the background connection to be established
+
+        The native library connects asynchronously and offers no completion
+        callback, so this checks is_connected() every poll_interval seconds
+        and returns as soon as it reports True.
+
+        Args:
+            timeout: Maximum time to wait in seconds (default: 2.0)
+            poll_interval: How often to check the connection in seconds (default: 0.005)
+
+        Returns:
+            True if connected, False if timeout
+        """
+        deadline = time.monotonic() + timeout
+        while not self.is_connected():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            time.sleep(min(poll_interval, remaining))
+        return True
 
     # ========================================================================
     # COMMAND METHODS
@@ -428,21 +548,26 @@ class ProHandClient:
         Returns:
             True if in running state, False otherwise
         """
-        result = _lib.prohand_is_running_state(self._handle)
-        return result == 1
+        # Compared against 1 rather than declared with a c_bool restype: the
+        # C function returns an int that is negative on error, which c_bool
+        # would report as True
+        return _is_running_state(self._handle) == 1
 
     def wait_for_streaming_ready(
-        self, timeout: float = 1.0, retry_interval: float = 0.3
+        self, timeout: float = 1.0, retry_interval: float = 0.3, poll_interval: float = 0.01
     ) -> bool:
         """
         Wait for streaming connection to be established with state verification
 
         This method repeatedly sends set_streaming_mode(True) and polls for
-        Running state until confirmed or timeout.
+        Running state until confirmed or timeout. The native library offers no
+        blocking wait on the status channel, so it returns within poll_interval
+        of the driver reporting Running state.
 
         Args:
             timeout: Maximum time to wait in seconds (default: 1.0)
             retry_interval: How often to retry set_streaming_mode in seconds (default: 0.3)
+            poll_interval: How often to check for Running state in seconds (default: 0.01)
 
         Returns:
             True if ready and in Running state, False if timeout
@@ -453,45 +578,38 @@ class ProHandClient:
                 # Driver is confirmed in Running state
                 client.send_rotary_streams(positions, torques)
         """
-        import time
-
-        # First, verify command channel is working
-        try:
-            self.send_ping()
-        except:
+        # First, verify command channel is working. Result codes are checked
+        # directly here instead of raising and swallowing SDK exceptions.
+        if _lib.prohand_send_ping(self._handle) != ProHandResult.SUCCESS:
             return False
 
-        start_time = time.time()
-        last_retry_time = start_time
-        poll_interval = 0.05  # Poll every 50ms
-
-        # Initial delay for ZMQ PUB/SUB connection to establish
-        time.sleep(0.2)
-
-        # Keep retrying set_streaming_mode until Running state is detected
-        while (time.time() - start_time) < timeout:
+        # One monotonic reading per iteration, shared by the timeout and
+        # retry checks
+        monotonic_ns = time.monotonic_ns
+        deadline = monotonic_ns() + int(timeout * 1e9)
+        retry_ns = int(retry_interval * 1e9)
+        last_retry = monotonic_ns()
+
+        # Keep retrying set_streaming_mode until Running state is detected.
+        # Polling starts right away rather than after a fixed settle delay;
+        # the ZMQ PUB/SUB slow-joiner time is simply spent in this loop.
+        while True:
             # Check if driver reports Running state
             if self.is_running_state():
                 return True
 
+            now = monotonic_ns()
+            if now >= deadline:
+                return False
+
             # Retry set_streaming_mode if enough time has passed
-            elapsed_since_retry = time.time() - last_retry_time
-            if elapsed_since_retry >= retry_interval:
-                try:
-                    self.set_streaming_mode(True)
-                    last_retry_time = time.time()
-                except:
-                    pass  # Ignore errors, keep trying
-
-            # Wait before next poll
-            remaining = timeout - (time.time() - start_time)
-            if remaining > 0:
-                time.sleep(min(poll_interval, remaining))
-            else:
-                break
+            if now - last_retry >= retry_ns:
+                # Ignore errors, keep trying
+                if _lib.prohand_set_streaming_mode(self._handle, 1) == ProHandResult.SUCCESS:
+                    last_retry = now
 
-        # Timeout - check one last time
-        return self.is_running_state()
+            # Wait before next poll; the check after the deadline is the last one
+            time.sleep(min(poll_interval, (deadline - now) / 1e9))
 
     def send_rotary_commands(self, positions: List[float], torques: List[float]):
         """
@@ -507,8 +625,8 @@ class ProHandClient:
         if len(positions) != 16 or len(torques) != 16:
             raise InvalidArgumentError("positions and torques must have 16 elements")
 
-        pos_array = (c_float * 16)(*positions)
-        torque_array = (c_float * 16)(*torques)
+        pos_array = _as_float_array(positions, 16)
+        torque_array = _as_float_array(torques, 16)
 
         result = _lib.prohand_send_rotary_commands(
             self._handle, pos_array, torque_array
@@ -525,6 +643,8 @@ class ProHandClient:
         Args:
             positions: List of 16 position values in radians
             torques: List of 16 torque values (normalized 0.0 to 1.0)
+            Either may be a c_float array or float32 buffer (array.array('f'),
+            numpy float32 array), which is passed without copying.
 
         Raises:
             ConnectionError: If streaming endpoint was not provided or driver not in streaming mode
@@ -532,10 +652,10 @@ class ProHandClient:
         if len(positions) != 16 or len(torques) != 16:
             raise InvalidArgumentError("positions and torques must have 16 elements")
 
-        pos_array = (c_float * 16)(*positions)
-        torque_array = (c_float * 16)(*torques)
+        pos_array = _as_float_array(positions, 16, self._rotary_pos)
+        torque_array = _as_float_array(torques, 16, self._rotary_torque)
 
-        result = _lib.prohand_send_rotary_streams(self._handle, pos_array, torque_array)
+        result = _send_rotary_streams(self._handle, pos_array, torque_array)
         _check_result(result, "send_rotary_streams")
 
     def send_linear_commands(self, positions: List[float], speeds: List[float]):
@@ -552,8 +672,8 @@ class ProHandClient:
         if len(positions) != 2 or len(speeds) != 2:
             raise InvalidArgumentError("positions and speeds must have 2 elements")
 
-        pos_array = (c_float * 2)(*positions)
-        vel_array = (c_float * 2)(*speeds)
+        pos_array = _as_float_array(positions, 2)
+        vel_array = _as_float_array(speeds, 2)
 
         result = _lib.prohand_send_linear_commands(self._handle, pos_array, vel_array)
         _check_result(result, "send_linear_commands")
@@ -568,6 +688,8 @@ class ProHandClient:
         Args:
             positions: List of 2 position values in radians
             speeds: List of 2 speed values (normalized 0.0 to 1.0)
+            Either may be a c_float array or float32 buffer (array.array('f'),
+            numpy float32 array), which is passed without copying.
 
         Raises:
             ConnectionError: If streaming endpoint was not provided or driver not in streaming mode
@@ -575,10 +697,10 @@ class ProHandClient:
         if len(positions) != 2 or len(speeds) != 2:
             raise InvalidArgumentError("positions and speeds must have 2 elements")
 
-        pos_array = (c_float * 2)(*positions)
-        vel_array = (c_float * 2)(*speeds)
+        pos_array = _as_float_array(positions, 2, self._linear_pos)
+        vel_array = _as_float_array(speeds, 2, self._linear_speed)
 
-        result = _lib.prohand_send_linear_streams(self._handle, pos_array, vel_array)
+        result = _send_linear_streams(self._handle, pos_array, vel_array)
         _check_result(result, "send_linear_streams")
 
     def send_wrist_command(self, positions: List[float], use_profiler: bool = False):
@@ -594,11 +716,8 @@ class ProHandClient:
         """
         if len(positions) != 2:
             raise InvalidArgumentError("positions must have 2 elements")
-        pos_array = (c_float * 2)(*positions)
-        if use_profiler:
-            result = _lib.prohand_send_wrist_command(self._handle, pos_array, True)
-        else:
-            result = _lib.prohand_send_wrist_command(self._handle, pos_array, False)
+        pos_array = _as_float_array(positions, 2)
+        result = _lib.prohand_send_wrist_command(self._handle, pos_array, use_profiler)
         _check_result(result, "send_wrist_command")
 
     def send_wrist_streams(self, positions: List[float], use_profiler: bool = False):
@@ -609,16 +728,15 @@ class ProHandClient:
         Requires: Client created with streaming endpoint AND driver in streaming mode.
 
         Args:
-            positions: List of 2 wrist joint angles in radians
+            positions: List of 2 wrist joint angles in radians. A c_float array or
+                      float32 buffer (array.array('f'), numpy float32 array) is
+                      passed without copying.
             use_profiler: Whether to enable wrist motion profiling (position-only, implicit max velocity)
         """
         if len(positions) != 2:
             raise InvalidArgumentError("positions must have 2 elements")
-        pos_array = (c_float * 2)(*positions)
-        if use_profiler:
-            result = _lib.prohand_send_wrist_streams(self._handle, pos_array, True)
-        else:
-            result = _lib.prohand_send_wrist_streams(self._handle, pos_array, False)
+        pos_array = _as_float_array(positions, 2, self._wrist_pos)
+        result = _send_wrist_streams(self._handle, pos_array, use_profiler)
         _check_result(result, "send_wrist_streams")
 
     def set_wrist_limits(self, max_velocity: List[float], max_acceleration: List[float], max_jerk: List[float]):
@@ -661,8 +779,8 @@ class ProHandClient:
         if len(positions) != 20:
             raise InvalidArgumentError("positions must have 20 elements (5 fingers × 4 joints)")
 
-        pos_array = (c_float * 20)(*positions)
-        result = _lib.prohand_send_hand_command(self._handle, pos_array, c_float(torque))
+        pos_array = _as_float_array(positions, 20)
+        result = _lib.prohand_send_hand_command(self._handle, pos_array, torque)
         _check_result(result, "send_hand_command")
 
     def send_hand_streams(self, positions: List[float], torque: float = 0.45):
@@ -678,6 +796,8 @@ class ProHandClient:
         Args:
             positions: List of 20 floats (5 fingers × 4 joints) in radians
                       Order: thumb[0-3], index[4-7], middle[8-11], ring[12-15], pinky[16-19]
+                      A c_float array or float32 buffer (array.array('f'),
+                      numpy float32 array) is passed without copying.
             torque: Single torque value (normalized 0.0 to 1.0) applied to all joints
 
         Raises:
@@ -697,8 +817,8 @@ class ProHandClient:
         if len(positions) != 20:
             raise InvalidArgumentError("positions must have 20 elements (5 fingers × 4 joints)")
 
-        pos_array = (c_float * 20)(*positions)
-        result = _lib.prohand_send_hand_streams(self._handle, pos_array, c_float(torque))
+        pos_array = _as_float_array(positions, 20, self._hand_pos)
+        result = _send_hand_streams(self._handle, pos_array, torque)
         _check_result(result, "send_hand_streams")
 
     def send_zero_calibration(self, mask: List[bool]):
@@ -711,7 +831,7 @@ class ProHandClient:
         if len(mask) != 16:
             raise InvalidArgumentError("mask must have 16 elements")
 
-        mask_array = (c_int * 16)(*[int(b) for b in mask])
+        mask_array = (c_int * 16)(*map(bool, mask))
         result = _lib.prohand_send_zero_calibration(self._handle, mask_array)
         _check_result(result, "send_zero_calibration")
 
@@ -726,16 +846,10 @@ class ProHandClient:
         Returns:
             HandStatus if available, None otherwise
         """
-        status_info = ProHandStatusInfo()
-        result = _lib.prohand_try_recv_status(self._handle, pointer(status_info))
+        result = _try_recv_status(self._handle, self._status_ref)
 
         if result > 0:
-            return HandStatus(
-                is_valid=bool(status_info.is_valid),
-                status_type=int(status_info.status_type),
-                rotary_positions=list(status_info.rotary_positions),
-                linear_positions=list(status_info.linear_positions)
-            )
+            return _to_hand_status(self._status_buf)
         elif result == 0:
             return None
         else:
@@ -743,6 +857,35 @@ class ProHandClient:
             _check_result(result, "try_recv_status")
             return None  # Satisfy linter (never reached)
 
+    def try_recv_status_many(self, max_count: int = 64) -> List[HandStatus]:
+        """
+        Receive all queued statuses, up to max_count (non-blocking)
+
+        Drains a backlog (e.g. after a stall) in one call so callers can skip
+        straight to the newest status. The native library has no batch
+        receive, so this still makes one prohand_try_recv_status call per
+        status, all into the client's reused status struct.
+
+        Args:
+            max_count: Maximum number of statuses to receive (default: 64)
+
+        Returns:
+            List of HandStatus in arrival order (empty if none were queued)
+        """
+        statuses: List[HandStatus] = []
+        handle = self._handle
+        status_ref = self._status_ref
+        status_info = self._status_buf
+        for _ in range(max_count):
+            result = _try_recv_status(handle, status_ref)
+            if result > 0:
+                statuses.append(_to_hand_status(status_info))
+            elif result == 0:
+                break
+            else:
+                _check_result(result, "try_recv_status_many")
+        return statuses
+
 
 # ============================================================================
 # MODULE-LEVEL FUNCTIONS
@@ -764,20 +907,24 @@ def discover_usb_devices(max_devices: int = 10) -> List[UsbDevice]:
     if count < 0:
         _check_result(count, "discover_usb_devices")
     
+    string_at = ctypes.string_at
+    free_string = _lib.prohand_free_string
     result = []
-    for i in range(count):
-        dev = devices_array[i]
-        result.append(UsbDevice(
-            port_name=dev.port_name.decode('utf-8') if dev.port_name else "",
-            display_name=dev.display_name.decode('utf-8') if dev.display_name else ""
-        ))
-        
-        # Free the strings allocated by C
-        if dev.port_name:
-            _lib.prohand_free_string(dev.port_name)
-        if dev.display_name:
-            _lib.prohand_free_string(dev.display_name)
-    
+    for dev in devices_array[:count]:
+        # Each field access builds a new pointer object, so read them once
+        port_ptr = dev.port_name
+        display_ptr = dev.display_name
+        try:
+            port = string_at(port_ptr).decode('utf-8') if port_ptr else ""
+            display = string_at(display_ptr).decode('utf-8') if display_ptr else ""
+        finally:
+            # Free the strings allocated by C, even if decoding failed
+            if port_ptr:
+                free_string(port_ptr)
+            if display_ptr:
+                free_string(display_ptr)
+        result.append(UsbDevice(port_name=port, display_name=display))
+
     return result
 
 
@@ -826,9 +973,9 @@ def _example():
             print(f"  Valid: {status.is_valid}")
             print(f"  Type: {status.status_type}")
             if status.status_type == 1:
-                print(f"  Rotary positions: {status.rotary_positions[:4]}...")
+                print(f"  Rotary positions: {list(status.rotary_positions[:4])}...")
             elif status.status_type == 2:
-                print(f"  Linear positions: {status.linear_positions}...")
+                print(f"  Linear positions: {list(status.linear_positions)}...")
 
 
 if __name__ == '__main__':